@@ -5,9 +5,11 @@ Explicit configuration following the Zen of Python:
 - Explicit is better than implicit.
 """
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -16,14 +18,89 @@ class Settings(BaseSettings):
     # MongoDB
     mongodb_url: str = "mongodb://localhost:27017"
     database_name: str = "fletnix"
+    mongo_min_pool_size: int = 10  # Connections opened at startup and kept open
     
     # JWT
     secret_key: str = "your-super-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 1440  # 24 hours
+    jwt_backend: str = "jose"  # Or "pyjwt" (faster, needs the PyJWT package)
+    token_cache_size: int = 10000  # Verified tokens kept until they expire
+    
+    # Password hashing
+    bcrypt_rounds: int = 12  # Cost factor - changing it rehashes passwords on login
+    password_hash_workers: int = 2  # Threads for bcrypt (0 hashes on the event loop)
+    password_hash_queue_size: int = 32  # Sign-ins waiting beyond that get a 503
+    
+    # Rate limits for login and registration, per sliding window (0 turns one off)
+    rate_limit_window_seconds: int = 60
+    login_rate_limit_per_ip: int = 30
+    login_rate_limit_per_email: int = 10
+    register_rate_limit_per_ip: int = 20
+    register_rate_limit_per_email: int = 5
+    rate_limit_max_keys: int = 100000  # Clients tracked per worker
+    rate_limit_redis_url: str = ""  # Share limits between workers (needs the redis package)
+    # Take client IPs from X-Forwarded-For - unset trusts it only from
+    # private addresses, i.e. a proxy in front of us (Railway's, nginx...)
+    trust_forwarded_for: Optional[bool] = None
     
     # OMDB API
     omdb_api_key: str = ""
+    omdb_cache_size: int = 5000  # Titles kept in the in-process LRU
+    omdb_cache_ttl_hours: int = 168  # Refresh found titles weekly
+    omdb_negative_ttl_hours: int = 24  # Retry unknown titles daily
+    omdb_base_url: str = "https://www.omdbapi.com/"
+    omdb_http2: bool = False  # Needs the h2 package (httpx[http2])
+    omdb_max_connections: int = 20  # Pooled keep-alive connections
+    omdb_max_concurrency: int = 10  # Requests in flight to OMDB at once
+    omdb_timeout_seconds: float = 5.0  # Deadline per OMDB request
+    
+    # Posters missing from list pages are fetched in the background instead
+    # of holding up the response (False fetches them inline)
+    poster_hydration_background: bool = True
+    poster_hydration_workers: int = 4
+    poster_queue_size: int = 1000
+    poster_retry_seconds: int = 600  # Wait after a failed fetch before queueing a show again
+    
+    # In-memory catalog (search index) - how often to check for changes
+    catalog_refresh_seconds: int = 60
+    
+    # Unfiltered listings (when MongoDB answers them) take the total from
+    # collection metadata instead of counting - exact except after an
+    # unclean shutdown, and never a collection scan
+    estimated_count_unfiltered: bool = True
+    
+    # Show IDs (either form) resolved to their _id and genres, per worker
+    show_ref_cache_size: int = 20000
+    
+    # How long browsers and CDNs may reuse the genre list before revalidating
+    genres_cache_max_age: int = 300
+    
+    # Cached /api/shows list pages
+    response_cache_ttl_seconds: int = 30  # Served as is
+    response_cache_stale_seconds: int = 300  # Then served while refreshing in the background
+    response_cache_max_mb: int = 64  # Serialized pages kept per worker, in MB
+    response_cache_redis_url: str = ""  # Share pages between workers (needs the redis package)
+    
+    # "More like this" index, built by scripts/build_similarity_index.py
+    similarity_index_dir: str = "similarity_index"
+    
+    # Genre affinity profiles (recommendations)
+    affinity_half_life_days: float = Field(30.0, ge=1)  # A view this old counts half a new one
+    affinity_epoch: datetime = datetime(2024, 1, 1)  # Fixed - changing it rescales every profile
+    affinity_max_genres: int = 20  # Weakest genres beyond this are dropped
+    recommendation_top_genres: int = 5  # Genres recommendations draw from
+    
+    # User profiles (/me, recommendations) cached per worker
+    user_cache_size: int = 10000
+    user_cache_ttl_seconds: int = 300
+    
+    # Views are buffered and written in batches, whichever limit comes first
+    view_flush_size: int = 500  # Buffered views
+    view_flush_interval_seconds: float = 1.0
+    
+    # /metrics needs "Authorization: Bearer <token>" (empty turns it off)
+    metrics_token: str = ""
     
     # CORS - Frontend URL for production
     frontend_url: str = "http://localhost:5173"
@@ -2,8 +2,10 @@
 MongoDB database connection and initialization.
 """
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import UpdateOne
 from app.config import get_settings
+from app.utils.helpers import parse_genres, split_list
 
 settings = get_settings()
 
@@ -25,7 +27,9 @@ async def connect_to_database():
         settings.mongodb_url,
         serverSelectionTimeoutMS=5000,
         connectTimeoutMS=5000,
-        socketTimeoutMS=10000
+        socketTimeoutMS=10000,
+        # Kept open between bursts - warm-up opens them at startup
+        minPoolSize=settings.mongo_min_pool_size
     )
     db.db = db.client[settings.database_name]
     
@@ -50,6 +54,17 @@ async def connect_to_database():
         await db.db.shows.create_index("type")
         await db.db.shows.create_index("rating")
         await db.db.shows.create_index("listed_in")
+        await db.db.shows.create_index("show_id")
+        await db.db.shows.create_index([("updated_at", -1)])  # Newest edit, for catalog refreshes
+        
+        # Multikey indexes on the normalized arrays written by the importer
+        await db.db.shows.create_index("genres")
+        await db.db.shows.create_index("cast_list")
+        await db.db.shows.create_index("directors")
+        await db.db.shows.create_index("countries")
+        
+        # Compound index for the list ordering and cursor pagination
+        await db.db.shows.create_index([("date_added_parsed", -1), ("_id", -1)])
         
         # Create index for users
         await db.db.users.create_index("email", unique=True)
@@ -58,9 +73,55 @@ async def connect_to_database():
     except Exception as e:
         print(f"⚠️  Could not create indexes (continuing without): {e}")
     
+    # Shows imported before the normalized arrays existed have none - the
+    # genre list and filters read only the arrays
+    try:
+        await backfill_normalized_fields(db.db.shows)
+    except Exception as e:
+        print(f"⚠️  Could not backfill normalized show fields: {e}")
+    
     print("✅ Connected to MongoDB")
 
 
+def normalized_fields(show: dict) -> dict:
+    """The normalized arrays of a show, derived from its comma-joined fields."""
+    return {
+        "genres": [genre for genre in parse_genres(show.get("listed_in")) if genre],
+        "cast_list": split_list(show.get("cast")),
+        "directors": split_list(show.get("director")),
+        "countries": split_list(show.get("country")),
+    }
+
+
+async def backfill_normalized_fields(collection: AsyncIOMotorCollection, batch_size: int = 500) -> int:
+    """
+    Write the normalized arrays for shows that don't have them yet.
+    
+    Idempotent - shows that already have genres are left alone, so this is
+    one cheap query once every show has been backfilled. Returns the
+    number of shows updated.
+    """
+    cursor = collection.find(
+        {"genres": {"$exists": False}},
+        {"listed_in": 1, "cast": 1, "director": 1, "country": 1}
+    )
+    updated = 0
+    batch = []
+    async for show in cursor:
+        batch.append(UpdateOne({"_id": show["_id"]}, {"$set": normalized_fields(show)}))
+        if len(batch) >= batch_size:
+            await collection.bulk_write(batch, ordered=False)
+            updated += len(batch)
+            batch = []
+    if batch:
+        await collection.bulk_write(batch, ordered=False)
+        updated += len(batch)
+    
+    if updated:
+        print(f"🏷️  Backfilled normalized fields for {updated} shows")
+    return updated
+
+
 async def close_database_connection():
     """Close MongoDB connection."""
     if db.client:
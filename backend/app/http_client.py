@@ -0,0 +1,60 @@
+"""
+Shared HTTP client for outgoing API requests (OMDB).
+"""
+
+import asyncio
+import httpx
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class HTTPClient:
+    """Application-wide pooled HTTP client and OMDB concurrency limiter."""
+    
+    client: httpx.AsyncClient = None
+    omdb_limiter: asyncio.Semaphore = None
+
+
+http = HTTPClient()
+
+
+def _create_client() -> httpx.AsyncClient:
+    """Create a pooled keep-alive client, using HTTP/2 if enabled and available."""
+    limits = httpx.Limits(
+        max_connections=settings.omdb_max_connections,
+        max_keepalive_connections=settings.omdb_max_connections,
+        keepalive_expiry=60.0
+    )
+    timeout = httpx.Timeout(settings.omdb_timeout_seconds)
+    
+    if settings.omdb_http2:
+        try:
+            return httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+        except ImportError:
+            print("⚠️  HTTP/2 needs the h2 package (pip install httpx[http2]) - using HTTP/1.1")
+    
+    return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+async def open_http_client():
+    """Create the shared HTTP client."""
+    http.client = _create_client()
+    http.omdb_limiter = asyncio.Semaphore(settings.omdb_max_concurrency)
+    print("🌐 Opened HTTP client")
+
+
+async def close_http_client():
+    """Close the shared HTTP client and its pooled connections."""
+    if http.client:
+        await http.client.aclose()
+        http.client = None
+        print("🌐 Closed HTTP client")
+
+
+def get_http_client() -> HTTPClient:
+    """Get the shared HTTP client (created on first use outside the app)."""
+    if http.client is None:
+        http.client = _create_client()
+        http.omdb_limiter = asyncio.Semaphore(settings.omdb_max_concurrency)
+    return http
@@ -10,13 +10,27 @@ Built following the Zen of Python:
 - Readability counts
 """
 
-from fastapi import FastAPI
+import asyncio
+import secrets
+import time
+from typing import Optional
+from fastapi import FastAPI, Header, HTTPException, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.config import get_settings
-from app.database import connect_to_database, close_database_connection
+from app.database import connect_to_database, close_database_connection, get_database
+from app.http_client import open_http_client, close_http_client
+from app.services.catalog import catalog
+from app.services.password_hasher import password_hasher
+from app.services.poster_hydrator import poster_hydrator
+from app.services.rate_limiter import rate_limiter
+from app.services.user_cache import user_cache
+from app.services.view_buffer import view_buffer
 from app.routes import auth_router, shows_router
+from app.utils.security import token_cache
+from app.warmup import warmup
 
 settings = get_settings()
 
@@ -25,9 +39,26 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown."""
     # Startup
+    started_at = time.perf_counter()
     await connect_to_database()
+    await open_http_client()
+    refresh_task = asyncio.create_task(
+        catalog.watch(get_database(), settings.catalog_refresh_seconds)
+    )
+    poster_hydrator.start()
+    view_buffer.start()
+    # Serving starts now; /ready waits for the warm-up
+    warmup_task = asyncio.create_task(warmup.run(app, started_at))
+    print(f"🚀 Started in {(time.perf_counter() - started_at) * 1000:.0f} ms, warming up")
     yield
     # Shutdown
+    warmup_task.cancel()
+    refresh_task.cancel()
+    await poster_hydrator.stop()
+    # Before the database closes - acknowledged views must be written
+    await view_buffer.stop()
+    password_hasher.shutdown()
+    await close_http_client()
     await close_database_connection()
 
 
@@ -91,3 +122,34 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/ready", tags=["Health"])
+async def readiness_check():
+    """Readiness check - 503 until the startup warm-up has finished."""
+    return JSONResponse(
+        warmup.status(),
+        status_code=200 if warmup.ready else 503
+    )
+
+
+@app.get("/metrics", tags=["Health"])
+async def metrics(authorization: Optional[str] = Header(None)):
+    """Internal queue depths and latencies - needs the METRICS_TOKEN."""
+    if not settings.metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not secrets.compare_digest(authorization or "", f"Bearer {settings.metrics_token}"):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return {
+        "view_buffer": view_buffer.metrics(),
+        "password_hasher": password_hasher.metrics(),
+        "token_cache": token_cache.metrics(),
+        "user_cache": user_cache.metrics(),
+        "rate_limiter": rate_limiter.metrics(),
+        "poster_queue": poster_hydrator.queue.qsize()
+    }
@@ -13,12 +13,19 @@ from app.models.user import (
 from app.models.show import (
     ShowBase,
     ShowResponse,
+    ShowSummary,
+    ShowFacets,
     ShowListResponse,
+    ShowSummaryListResponse,
     ShowDetailResponse,
+    GenreCount,
     ReviewResponse,
     ShowReviewsResponse,
     ViewHistoryCreate,
-    RecommendationResponse
+    ViewBatchCreate,
+    ViewBatchResponse,
+    RecommendationResponse,
+    SimilarShowsResponse
 )
 
 __all__ = [
@@ -30,10 +37,17 @@ __all__ = [
     "TokenData",
     "ShowBase",
     "ShowResponse",
+    "ShowSummary",
+    "ShowFacets",
     "ShowListResponse",
+    "ShowSummaryListResponse",
     "ShowDetailResponse",
+    "GenreCount",
     "ReviewResponse",
     "ShowReviewsResponse",
     "ViewHistoryCreate",
-    "RecommendationResponse"
+    "ViewBatchCreate",
+    "ViewBatchResponse",
+    "RecommendationResponse",
+    "SimilarShowsResponse"
 ]
@@ -3,7 +3,7 @@ Pydantic models for Show operations.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 
 
@@ -33,6 +33,26 @@ class ShowResponse(ShowBase):
         from_attributes = True
 
 
+class ShowSummary(BaseModel):
+    """Lean show response with what a show card needs (view=summary)."""
+    id: str
+    type: str
+    title: str
+    release_year: Optional[int] = None
+    rating: Optional[str] = None
+    duration: Optional[str] = None
+    listed_in: Optional[str] = None
+    description: Optional[str] = None
+    poster: Optional[str] = None
+    imdb_rating: Optional[str] = None
+
+
+class ShowFacets(BaseModel):
+    """Title counts per facet value under the current filters."""
+    types: Dict[str, int] = {}
+    genres: Dict[str, int] = {}
+
+
 class ShowListResponse(BaseModel):
     """Paginated list of shows response."""
     shows: List[ShowResponse]
@@ -41,6 +61,14 @@ class ShowListResponse(BaseModel):
     pages: int
     has_next: bool
     has_prev: bool
+    facets: Optional[ShowFacets] = None
+    next_cursor: Optional[str] = None
+    posters_pending: bool = False  # Some posters are still loading - fetch again shortly
+
+
+class ShowSummaryListResponse(ShowListResponse):
+    """Paginated list of lean shows (view=summary)."""
+    shows: List[ShowSummary]
 
 
 class ShowDetailResponse(ShowBase):
@@ -52,6 +80,12 @@ class ShowDetailResponse(ShowBase):
     poster: Optional[str] = None
 
 
+class GenreCount(BaseModel):
+    """A genre and how many titles are in it."""
+    name: str
+    count: int
+
+
 class ReviewResponse(BaseModel):
     """IMDB review response model."""
     source: str
@@ -74,7 +108,25 @@ class ViewHistoryCreate(BaseModel):
     show_id: str
 
 
+class ViewBatchCreate(BaseModel):
+    """Request to track several views at once."""
+    show_ids: List[str] = Field(..., min_length=1, max_length=100)
+
+
+class ViewBatchResponse(BaseModel):
+    """Result of tracking several views."""
+    tracked: int
+    not_found: List[str] = []
+
+
+class SimilarShowsResponse(BaseModel):
+    """Shows similar to a given show, most similar first."""
+    shows: List[ShowResponse]
+    posters_pending: bool = False
+
+
 class RecommendationResponse(BaseModel):
     """Recommendation response model."""
     shows: List[ShowResponse]
     based_on_genres: List[str]
+    posters_pending: bool = False
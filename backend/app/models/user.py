@@ -34,7 +34,9 @@ class UserInDB(BaseModel):
     hashed_password: str
     age: int
     created_at: datetime
-    viewed_genres: list[str] = []
+    genre_affinity: dict[str, float] = {}  # Escaped genre -> decayed view weight
+    affinity_era: int = 0  # Era the genre_affinity weights are scaled to
+    viewed_genres: list[str] = []  # Older, unweighted profile
 
 
 class Token(BaseModel):
@@ -2,12 +2,13 @@
 Authentication routes.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.database import get_database
 from app.models.user import UserRegister, UserLogin, UserResponse, Token
 from app.services.auth_service import AuthService
+from app.services.rate_limiter import rate_limiter
 from app.utils.security import get_current_user
 from app.models.user import TokenData
 
@@ -17,6 +18,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 @router.post("/register", response_model=UserResponse, status_code=201)
 async def register(
     user_data: UserRegister,
+    request: Request,
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
     """
@@ -25,7 +27,11 @@ async def register(
     - **email**: Valid email address
     - **password**: Password (minimum 6 characters)
     - **age**: User's age (1-120)
+    
+    Limited per client IP and per email - over the limit answers 429
+    with Retry-After.
     """
+    await rate_limiter.check_register(request, user_data.email)
     auth_service = AuthService(db)
     return await auth_service.register(user_data)
 
@@ -33,6 +39,7 @@ async def register(
 @router.post("/login", response_model=Token)
 async def login(
     credentials: UserLogin,
+    request: Request,
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
     """
@@ -40,7 +47,11 @@ async def login(
     
     - **email**: Registered email address
     - **password**: User's password
+    
+    Limited per client IP and per email - over the limit answers 429
+    with Retry-After.
     """
+    await rate_limiter.check_login(request, credentials.email)
     auth_service = AuthService(db)
     return await auth_service.login(credentials)
 
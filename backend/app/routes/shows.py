@@ -2,27 +2,83 @@
 Shows routes for movies and TV shows.
 """
 
-from typing import Optional, List
-from fastapi import APIRouter, Depends, Query
+from typing import Optional, List, Tuple, Union
+from fastapi import APIRouter, Depends, Query, Request, Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.config import get_settings
 from app.database import get_database
 from app.models.show import (
     ShowListResponse,
+    ShowSummaryListResponse,
     ShowDetailResponse,
+    GenreCount,
     ShowReviewsResponse,
     ViewHistoryCreate,
-    RecommendationResponse
+    ViewBatchCreate,
+    ViewBatchResponse,
+    RecommendationResponse,
+    SimilarShowsResponse
 )
 from app.models.user import TokenData
 from app.services.show_service import ShowService
 from app.services.imdb_service import IMDBService
+from app.services.catalog import catalog
+from app.services.response_cache import response_cache
 from app.utils.security import get_current_user, get_current_user_optional
+from app.utils.responses import json_dumps, FastJSONResponse
+
+settings = get_settings()
 
 router = APIRouter(prefix="/shows", tags=["Shows"])
 
 
-@router.get("", response_model=ShowListResponse)
+def _genre_cache_headers(etag: str) -> dict:
+    """HTTP caching headers for the genre list."""
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.genres_cache_max_age}"
+    }
+
+
+def _list_cache_key(
+    page: int,
+    limit: int,
+    show_type: Optional[str],
+    search: Optional[str],
+    genre: Optional[str],
+    kids_mode: bool,
+    user_age: Optional[int],
+    rank: bool,
+    cursor: Optional[str],
+    fields: Optional[List[str]]
+) -> str:
+    """
+    Normalized cache key for a shows list page.
+    
+    Only whether the user is under 18 changes the results, so every adult
+    and anonymous visitor shares the same entries. The catalog version
+    retires every entry when the data is re-imported - it comes from
+    catalog_meta, so it matches across workers sharing a Redis cache.
+    """
+    age_bucket = "minor" if user_age is not None and user_age < 18 else "all"
+    search = " ".join(search.casefold().split()) if search else ""
+    return "|".join([
+        f"v{catalog.version}",
+        str(page),
+        str(limit),
+        show_type or "",
+        search,
+        genre or "",
+        "kids" if kids_mode else "",
+        age_bucket,
+        "rank" if rank else "",
+        cursor or "",
+        ",".join(fields) if fields else ""
+    ])
+
+
+@router.get("", response_model=Union[ShowListResponse, ShowSummaryListResponse])
 async def get_shows(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(15, ge=1, le=100, description="Items per page"),
@@ -30,6 +86,10 @@ async def get_shows(
     search: Optional[str] = Query(None, description="Search in title, cast, director"),
     genre: Optional[str] = Query(None, description="Filter by genre"),
     kids_mode: bool = Query(False, description="Filter out R-rated and adult content"),
+    rank: bool = Query(False, description="Order search results by relevance instead of date added"),
+    cursor: Optional[str] = Query(None, description="Continue after a previous page's next_cursor"),
+    view: str = Query("full", pattern="^(full|summary)$", description="summary: only what a show card needs"),
+    fields: Optional[str] = Query(None, description="Comma-separated show fields to return (overrides view)"),
     current_user: Optional[TokenData] = Depends(get_current_user_optional),
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
@@ -42,32 +102,85 @@ async def get_shows(
     - **search**: Search in title, cast, and director
     - **genre**: Filter by genre
     - **kids_mode**: Filter out R-rated/TV-MA content (default: false)
+    - **rank**: Order search results by relevance (default: false)
+    - **cursor**: `next_cursor` from the previous page - seeks instead of
+      skipping, so deep pages stay fast for infinite scroll (ignores page and rank)
+    - **view**: `summary` leaves out cast, director, country and dates
+    - **fields**: Exactly which show fields to return, e.g. `title,poster`
     
     Note: Users under 18 will not see R-rated content.
+    
+    Pages are served from a short-lived response cache; the X-Cache header
+    says whether this one was a HIT, STALE (refreshing) or MISS.
     """
     show_service = ShowService(db)
     user_age = current_user.age if current_user else None
+    show_fields = ShowService.resolve_fields(view, fields)
+    
+    async def render() -> Tuple[bytes, bool]:
+        shows = await show_service.get_shows(
+            page=page,
+            limit=limit,
+            show_type=type,
+            search=search,
+            genre=genre,
+            user_age=user_age,
+            kids_mode=kids_mode,
+            ranked=rank,
+            cursor=cursor,
+            fields=show_fields
+        )
+        # Pages still waiting for posters aren't cached, so polling sees them arrive
+        return json_dumps(shows), not shows["posters_pending"]
     
-    return await show_service.get_shows(
-        page=page,
-        limit=limit,
-        show_type=type,
-        search=search,
-        genre=genre,
-        user_age=user_age,
-        kids_mode=kids_mode
+    key = _list_cache_key(
+        page, limit, type, search, genre, kids_mode, user_age, rank, cursor, show_fields
     )
+    content, status = await response_cache.get_or_compute(key, render)
+    return Response(content=content, media_type="application/json", headers={"X-Cache": status})
 
 
 @router.get("/genres", response_model=List[str])
 async def get_genres(
+    request: Request,
+    response: Response,
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
     """
     Get all available genres.
+    
+    Supports conditional requests - send the ETag back in If-None-Match
+    to get a 304 while the genres are unchanged.
     """
     show_service = ShowService(db)
-    return await show_service.get_genres()
+    genres, etag = await show_service.get_genre_counts()
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=_genre_cache_headers(etag))
+    
+    response.headers.update(_genre_cache_headers(etag))
+    return [genre.name for genre in genres]
+
+
+@router.get("/genres/counts", response_model=List[GenreCount])
+async def get_genre_counts(
+    request: Request,
+    response: Response,
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Get all available genres with the number of titles in each.
+    
+    Supports conditional requests like /genres.
+    """
+    show_service = ShowService(db)
+    genres, etag = await show_service.get_genre_counts()
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=_genre_cache_headers(etag))
+    
+    response.headers.update(_genre_cache_headers(etag))
+    return genres
 
 
 @router.get("/{show_id}", response_model=ShowDetailResponse)
@@ -107,6 +220,33 @@ async def get_show_reviews(
     )
 
 
+@router.get("/{show_id}/similar", response_model=SimilarShowsResponse)
+async def get_similar_shows(
+    show_id: str,
+    limit: int = Query(10, ge=1, le=50, description="Number of similar shows"),
+    kids_mode: bool = Query(False, description="Filter out R-rated and adult content"),
+    current_user: Optional[TokenData] = Depends(get_current_user_optional),
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Get shows similar to a show ("more like this").
+    
+    Similarity is based on genres, cast, director, country and description.
+    
+    - **show_id**: MongoDB ID or show_id of the show
+    
+    Note: Users under 18 will not see R-rated content.
+    """
+    show_service = ShowService(db)
+    similar = await show_service.get_similar_shows(
+        show_id=show_id,
+        user_age=current_user.age if current_user else None,
+        kids_mode=kids_mode,
+        limit=limit
+    )
+    return FastJSONResponse(similar)
+
+
 @router.post("/view", status_code=201)
 async def track_view(
     view_data: ViewHistoryCreate,
@@ -123,6 +263,23 @@ async def track_view(
     return {"message": "View tracked successfully"}
 
 
+@router.post("/views", response_model=ViewBatchResponse, status_code=201)
+async def track_views(
+    view_data: ViewBatchCreate,
+    current_user: TokenData = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Track several views at once (e.g. synced from an offline client).
+    
+    - **show_ids**: IDs of the shows that were viewed (up to 100)
+    
+    Unknown shows are listed in `not_found`; the rest are still tracked.
+    """
+    show_service = ShowService(db)
+    return await show_service.track_views(current_user.user_id, view_data.show_ids)
+
+
 @router.get("/user/recommendations", response_model=RecommendationResponse)
 async def get_recommendations(
     limit: int = Query(10, ge=1, le=50, description="Number of recommendations"),
@@ -135,8 +292,9 @@ async def get_recommendations(
     Recommendations are based on the genres of shows the user has viewed.
     """
     show_service = ShowService(db)
-    return await show_service.get_recommendations(
+    recommendations = await show_service.get_recommendations(
         user_id=current_user.user_id,
         user_age=current_user.age,
         limit=limit
     )
+    return FastJSONResponse(recommendations)
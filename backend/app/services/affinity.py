@@ -0,0 +1,131 @@
+"""
+Decaying genre affinity profiles.
+
+A user's profile maps genre -> decayed view count. Instead of decaying
+every stored count over time, each new view adds a weight that grows
+exponentially from a reference epoch:
+
+    weight(t) = 2 ** ((t - epoch) / half_life)
+
+Every stored value shrinks by the same factor relative to new views, so
+ranking the raw values ranks the decayed counts. A view one half-life old
+counts half a new one.
+
+To keep weights within float range, the epoch moves forward in eras of
+ERA_HALF_LIVES half-lives. Each profile stores the era its values are
+scaled to (affinity_era, 0 for profiles written before eras), and the
+update that records a view first rescales an older profile to the
+current era - still a single atomic update.
+"""
+
+import math
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# The epoch moves forward by this many half-lives at a time, so a new
+# view weighs at most 2 ** ERA_HALF_LIVES
+ERA_HALF_LIVES = 64
+
+# MongoDB field names can't contain "." or start with "$"
+_KEY_ESCAPES = {".": "．", "$": "＄"}
+
+
+def genre_key(genre: str) -> str:
+    """Escape a genre for use as a field name in the profile."""
+    for char, escaped in _KEY_ESCAPES.items():
+        genre = genre.replace(char, escaped)
+    return genre
+
+
+def genre_from_key(key: str) -> str:
+    """Undo genre_key."""
+    for char, escaped in _KEY_ESCAPES.items():
+        key = key.replace(escaped, char)
+    return key
+
+
+def _half_lives(viewed_at: datetime) -> float:
+    elapsed = (viewed_at - settings.affinity_epoch).total_seconds()
+    return elapsed / (settings.affinity_half_life_days * 86400)
+
+
+def view_era(viewed_at: datetime) -> int:
+    """Era that views at the given time are weighted in."""
+    return math.floor(_half_lives(viewed_at) / ERA_HALF_LIVES)
+
+
+def view_weight(viewed_at: datetime, era: int) -> float:
+    """Weight of a view at the given time, scaled to the given era."""
+    return 2.0 ** (_half_lives(viewed_at) - era * ERA_HALF_LIVES)
+
+
+def view_increments(genres: List[str], viewed_at: datetime) -> Dict[str, float]:
+    """Increments for a view of a show in the given genres, in view_era(viewed_at)."""
+    weight = view_weight(viewed_at, view_era(viewed_at))
+    return {f"genre_affinity.{genre_key(genre)}": weight for genre in genres}
+
+
+def rescale(values: Dict[str, float], era: int, to_era: int) -> Dict[str, float]:
+    """Copy of a profile (or increments) scaled from one era to another."""
+    if era == to_era:
+        return dict(values)
+    # Underflows to 0.0 for profiles untouched for many eras - fully decayed
+    factor = 2.0 ** ((era - to_era) * ERA_HALF_LIVES)
+    return {key: value * factor for key, value in values.items()}
+
+
+def _era_factor(era, to_era) -> dict:
+    return {"$pow": [2, {"$multiply": [ERA_HALF_LIVES, {"$subtract": [era, to_era]}]}]}
+
+
+def affinity_update(increments: Dict[str, float], era: int) -> List[dict]:
+    """
+    Update pipeline adding increments (scaled to era) to a user's profile.
+    
+    The profile ends up in the later of its stored era and era: the stored
+    values are rescaled first, then the increments are added.
+    """
+    stored_era = {"$ifNull": ["$affinity_era", 0]}
+    to_era = {"$max": [stored_era, era]}
+    return [
+        {"$set": {
+            "affinity_era": to_era,
+            "genre_affinity": {"$arrayToObject": {"$map": {
+                "input": {"$objectToArray": {"$ifNull": ["$genre_affinity", {}]}},
+                "in": {"k": "$$this.k", "v": {"$multiply": ["$$this.v", _era_factor(stored_era, to_era)]}}
+            }}}
+        }},
+        {"$set": {
+            key: {"$add": [
+                {"$ifNull": [f"${key}", 0]},
+                {"$multiply": [weight, _era_factor(era, "$affinity_era")]}
+            ]}
+            for key, weight in increments.items()
+        }}
+    ]
+
+
+def weakest_genres(affinity: Dict[str, float], keep: int) -> List[str]:
+    """Profile keys to drop so that only the strongest keep genres remain."""
+    if len(affinity) <= keep:
+        return []
+    return sorted(affinity, key=affinity.get)[:len(affinity) - keep]
+
+
+def without_genres(affinity: Dict[str, float], keys: List[str]) -> Dict[str, float]:
+    """Copy of a profile without the given keys."""
+    dropped = set(keys)
+    return {key: value for key, value in affinity.items() if key not in dropped}
+
+
+def top_genres(affinity: Dict[str, float], k: int) -> List[Tuple[str, float]]:
+    """Get the k strongest genres, weighted relative to the strongest (1.0)."""
+    ranked = sorted(affinity.items(), key=lambda item: item[1], reverse=True)[:k]
+    if not ranked or ranked[0][1] <= 0:
+        return []
+    strongest = ranked[0][1]
+    return [(genre_from_key(key), value / strongest) for key, value in ranked]
@@ -3,12 +3,13 @@ Authentication service for user operations.
 """
 
 from datetime import datetime
-from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import HTTPException, status
 
 from app.models.user import UserRegister, UserLogin, UserResponse, Token
-from app.utils.security import hash_password, verify_password, create_access_token
+from app.services.password_hasher import password_hasher
+from app.services.user_cache import user_cache
+from app.utils.security import create_access_token
 
 
 class AuthService:
@@ -31,10 +32,10 @@ class AuthService:
         # Create user document
         user_doc = {
             "email": user_data.email,
-            "hashed_password": hash_password(user_data.password),
+            "hashed_password": await password_hasher.hash(user_data.password),
             "age": user_data.age,
             "created_at": datetime.utcnow(),
-            "viewed_genres": []
+            "genre_affinity": {}
         }
         
         # Insert user
@@ -52,13 +53,27 @@ class AuthService:
         # Find user
         user = await self.collection.find_one({"email": credentials.email})
         
-        if not user or not verify_password(credentials.password, user["hashed_password"]):
+        valid, new_hash = False, None
+        if user:
+            valid, new_hash = await password_hasher.verify_and_update(
+                credentials.password, user["hashed_password"]
+            )
+        
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
+        # The hash was made at an older cost factor - upgrade it now that
+        # we have the password
+        if new_hash:
+            await self.collection.update_one(
+                {"_id": user["_id"], "hashed_password": user["hashed_password"]},
+                {"$set": {"hashed_password": new_hash}}
+            )
+        
         # Create access token
         access_token = create_access_token(
             data={
@@ -72,7 +87,7 @@ class AuthService:
     
     async def get_user_by_id(self, user_id: str) -> UserResponse:
         """Get user by ID."""
-        user = await self.collection.find_one({"_id": ObjectId(user_id)})
+        user = await user_cache.get(self.collection, user_id)
         
         if not user:
             raise HTTPException(
@@ -0,0 +1,267 @@
+"""
+In-process snapshot of the shows catalog.
+
+The catalog is loaded from MongoDB at startup and rebuilt whenever the
+indexed fields of the shows collection change - on a re-import, or an
+in-place edit that sets updated_at - so hot read paths such as search can
+be answered without scanning the collection.
+"""
+
+import asyncio
+import hashlib
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import bson
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.services.facets import FacetIndex
+from app.services.recommender import RecommendationIndex
+from app.services.search_index import SearchIndex
+
+
+def content_digest(docs: List[dict]) -> str:
+    """Short digest of a list of documents, stable across processes."""
+    digest = hashlib.blake2b(digest_size=8)
+    for doc in docs:
+        digest.update(bson.encode(doc))
+    return digest.hexdigest()
+
+
+class CatalogPage(NamedTuple):
+    """One page of shows selected from the catalog."""
+    ids: List[ObjectId]
+    total: int
+    facets: Dict[str, Dict[str, int]]
+    has_more: bool
+
+
+class Catalog:
+    """Snapshot of the shows collection ordered newest first."""
+    
+    # Sort order of the snapshot - matches the list endpoint ordering
+    SORT = [("date_added_parsed", -1), ("_id", -1)]
+    
+    # Only the fields the in-memory indexes need
+    PROJECTION = {
+        "title": 1,
+        "cast": 1,
+        "director": 1,
+        "type": 1,
+        "rating": 1,
+        "listed_in": 1,
+        "date_added_parsed": 1
+    }
+    
+    def __init__(self):
+        self.ready = False
+        # Bumped on every rebuild - caches derived from the catalog key on it
+        self.generation = 0
+        # Which data is loaded: the catalog_meta generation, count and a
+        # digest of the shows - unlike generation, the same in every worker,
+        # so shared caches key on it
+        self.version = ""
+        self.object_ids: List[ObjectId] = []
+        self.dates: List[Optional[datetime]] = []
+        self.search_index = SearchIndex()
+        self.facets = FacetIndex()
+        self.recommendations = RecommendationIndex()
+        self.fingerprint: Optional[Tuple] = None
+        self.changes: Optional[Tuple] = None
+        self._lock = asyncio.Lock()
+    
+    async def _changes(self, db: AsyncIOMotorDatabase) -> Tuple:
+        """
+        Cheap signature of the collection, checked before reading any show.
+        
+        The importer bumps the generation in catalog_meta on every swap; the
+        count and newest ID catch shows added without it, and the newest
+        updated_at catches edits - anything editing a show's title, cast,
+        director, type, rating or genres in place should set updated_at
+        (e.g. with $currentDate) for the catalog to pick it up.
+        """
+        meta, count, newest, edited = await asyncio.gather(
+            db.catalog_meta.find_one({"_id": "shows"}, {"generation": 1}),
+            db.shows.estimated_document_count(),
+            db.shows.find_one({}, {"_id": 1}, sort=[("_id", -1)]),
+            db.shows.find_one({}, {"updated_at": 1}, sort=[("updated_at", -1)])
+        )
+        return (
+            meta["generation"] if meta else 0,
+            count,
+            newest["_id"] if newest else None,
+            edited.get("updated_at") if edited else None
+        )
+    
+    async def _load_docs(self, db: AsyncIOMotorDatabase, generation: int) -> Tuple[Tuple, List[dict]]:
+        """
+        Read the indexed fields of every show, with a fingerprint of them.
+        
+        The fingerprint is the catalog_meta generation, the show count and a
+        digest of the indexed fields, so a change that doesn't touch them
+        (e.g. a poster) doesn't rebuild anything. Every worker reading the
+        same data gets the same fingerprint.
+        """
+        docs = await db.shows.find({}, self.PROJECTION).sort(self.SORT).to_list(length=None)
+        digest = await asyncio.to_thread(content_digest, docs)
+        return (generation, len(docs), digest), docs
+    
+    @staticmethod
+    def _build(docs: List[dict]) -> Tuple:
+        """Build every in-memory index for a list of shows (CPU-bound)."""
+        object_ids = [doc["_id"] for doc in docs]
+        dates = [doc.get("date_added_parsed") for doc in docs]
+        search_index = SearchIndex()
+        search_index.build(docs)
+        facets = FacetIndex()
+        facets.build(docs)
+        recommendations = RecommendationIndex()
+        recommendations.build(facets)
+        return object_ids, dates, search_index, facets, recommendations
+    
+    async def _rebuild(self, docs: List[dict], fingerprint: Tuple) -> None:
+        """Rebuild every in-memory index from the shows and swap them in."""
+        # Building takes about half a second for the full catalog - keep
+        # it off the event loop; requests use the old snapshot meanwhile
+        object_ids, dates, search_index, facets, recommendations = await asyncio.to_thread(self._build, docs)
+        
+        # Swap the new snapshot in all at once
+        self.object_ids = object_ids
+        self.dates = dates
+        self.search_index = search_index
+        self.facets = facets
+        self.recommendations = recommendations
+        self.fingerprint = fingerprint
+        self.version = ".".join(str(part) for part in fingerprint)
+        self.generation += 1
+        self.ready = True
+        
+        print(f"🗂️  Loaded catalog with {len(self.object_ids)} shows (generation {self.generation})")
+    
+    async def load(self, db: AsyncIOMotorDatabase) -> None:
+        """Load the catalog from scratch."""
+        async with self._lock:
+            changes = await self._changes(db)
+            fingerprint, docs = await self._load_docs(db, changes[0])
+            await self._rebuild(docs, fingerprint)
+            self.changes = changes
+    
+    async def refresh_if_changed(self, db: AsyncIOMotorDatabase) -> bool:
+        """
+        Rebuild the snapshot once if the indexed fields of any show changed.
+        
+        Only reads the shows when the cheap signature moved, so an idle
+        catalog costs four small queries per check.
+        """
+        async with self._lock:
+            changes = await self._changes(db)
+            if self.ready and changes == self.changes:
+                return False
+            fingerprint, docs = await self._load_docs(db, changes[0])
+            self.changes = changes
+            if self.ready and fingerprint == self.fingerprint:
+                return False
+            await self._rebuild(docs, fingerprint)
+            return True
+    
+    async def watch(self, db: AsyncIOMotorDatabase, interval: float) -> None:
+        """Periodically refresh the snapshot (runs until cancelled)."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_if_changed(db)
+            except Exception as e:
+                print(f"⚠️  Catalog refresh failed: {e}")
+    
+    def _sort_key(self, ordinal: int) -> Tuple:
+        """Key the snapshot is sorted by (descending) - shows without a date go last."""
+        date_added = self.dates[ordinal]
+        return date_added is not None, date_added or datetime.min, self.object_ids[ordinal]
+    
+    def position_after(self, date_added: Optional[datetime], object_id: ObjectId) -> int:
+        """Get the ordinal of the first show that sorts after the given position."""
+        target = (date_added is not None, date_added or datetime.min, object_id)
+        low, high = 0, len(self.object_ids)
+        while low < high:
+            middle = (low + high) // 2
+            if self._sort_key(middle) < target:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+    
+    def select(
+        self,
+        skip: int,
+        limit: int,
+        start: int = 0,
+        show_type: Optional[str] = None,
+        search: Optional[str] = None,
+        genre: Optional[str] = None,
+        user_age: Optional[int] = None,
+        kids_mode: bool = False,
+        ranked: bool = False
+    ) -> CatalogPage:
+        """
+        Select a page of shows matching the filters, with facet counts.
+        
+        Results begin at ordinal start (for cursor pagination) and then skip
+        a number of matches. Relevance ranking ignores start.
+        """
+        facets = self.facets
+        type_mask = facets.type_mask(show_type)
+        genre_mask = facets.genre_mask(genre)
+        base = facets.rating_mask(user_age, kids_mode)
+        
+        if search:
+            base &= self.search_index.bitmap(search)
+        
+        matched = base & type_mask & genre_mask
+        total = matched.bit_count()
+        
+        if ranked and search:
+            # Walk the ranking until the page is full - a bit string makes
+            # each membership check O(1) instead of shifting the bitmap
+            bits = format(matched, "b")[::-1]
+            ordinals = []
+            wanted = skip + limit
+            for ordinal in self.search_index.search(search, ranked=True):
+                if ordinal < len(bits) and bits[ordinal] == "1":
+                    ordinals.append(ordinal)
+                    if len(ordinals) == wanted:
+                        break
+            ordinals = ordinals[skip:]
+            has_more = wanted < total
+        else:
+            # Clear the bits before start so the page begins there
+            remaining = (matched >> start) << start
+            ordinals = facets.ordinals(remaining, skip, limit)
+            has_more = bool(ordinals) and remaining >> (ordinals[-1] + 1) != 0
+        
+        # Each facet is counted with every filter applied except its own
+        counts = {
+            "types": facets.counts(facets.types, base & genre_mask),
+            "genres": facets.counts(facets.genres, base & type_mask)
+        }
+        
+        return CatalogPage(
+            ids=[self.object_ids[ordinal] for ordinal in ordinals],
+            total=total,
+            facets=counts,
+            has_more=has_more
+        )
+    
+    def recommend(
+        self,
+        genre_weights: Dict[str, float],
+        limit: int,
+        user_age: Optional[int] = None
+    ) -> List[ObjectId]:
+        """Sample recommended show IDs for a genre profile (random when empty)."""
+        minor = user_age is not None and user_age < 18
+        ordinals = self.recommendations.sample(genre_weights, limit, minor)
+        return [self.object_ids[ordinal] for ordinal in ordinals]
+
+
+catalog = Catalog()
@@ -0,0 +1,107 @@
+"""
+Precomputed facet bitmaps for filtering and counting shows.
+
+Each bitmap is a Python int where bit N is set when the show with catalog
+ordinal N has that facet value. Filter combinations resolve with bitwise
+AND and counts come from popcount, without touching the database.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from app.utils.helpers import parse_genres
+
+# Ratings hidden from users under 18
+ADULT_RATINGS = ["R", "NC-17", "TV-MA"]
+
+# Ratings shown in kids mode
+KIDS_RATINGS = ["G", "TV-G", "TV-Y", "TV-Y7", "TV-Y7-FV", "PG", "TV-PG"]
+
+
+def bitmap_from_ordinals(ordinals: Iterable[int]) -> int:
+    """Build a bitmap with the given ordinals set."""
+    # Set bits in a byte buffer and convert once - OR-ing into an int
+    # copies the whole int for every ordinal
+    ordinals = list(ordinals)
+    if not ordinals:
+        return 0
+    buffer = bytearray((max(ordinals) >> 3) + 1)
+    for ordinal in ordinals:
+        buffer[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class FacetIndex:
+    """Bitmaps per show type, rating and genre."""
+    
+    def __init__(self):
+        self.all = 0
+        self.types: Dict[str, int] = {}
+        self.ratings: Dict[str, int] = {}
+        self.genres: Dict[str, int] = {}
+    
+    def build(self, docs: Iterable[dict]) -> None:
+        """Build the bitmaps from documents given in ordinal order."""
+        types: Dict[str, int] = defaultdict(int)
+        ratings: Dict[str, int] = defaultdict(int)
+        genres: Dict[str, int] = defaultdict(int)
+        size = 0
+        
+        for ordinal, doc in enumerate(docs):
+            bit = 1 << ordinal
+            size += 1
+            if doc.get("type"):
+                types[doc["type"]] |= bit
+            if doc.get("rating"):
+                ratings[doc["rating"]] |= bit
+            for genre in parse_genres(doc.get("listed_in")):
+                if genre:
+                    genres[genre] |= bit
+        
+        self.all = (1 << size) - 1
+        self.types = dict(types)
+        self.ratings = dict(ratings)
+        self.genres = dict(genres)
+    
+    def _any_rating(self, ratings: Iterable[str]) -> int:
+        """Bitmap of shows with any of the given ratings."""
+        bitmap = 0
+        for rating in ratings:
+            bitmap |= self.ratings.get(rating, 0)
+        return bitmap
+    
+    def rating_mask(self, user_age: Optional[int] = None, kids_mode: bool = False) -> int:
+        """Bitmap of shows allowed for the user's age and kids mode."""
+        mask = self.all
+        if user_age is not None and user_age < 18:
+            mask &= ~self._any_rating(ADULT_RATINGS)
+        if kids_mode:
+            mask &= self._any_rating(KIDS_RATINGS)
+        return mask
+    
+    def type_mask(self, show_type: Optional[str]) -> int:
+        """Bitmap of shows of the given type (all shows when not set)."""
+        return self.types.get(show_type, 0) if show_type else self.all
+    
+    def genre_mask(self, genre: Optional[str]) -> int:
+        """Bitmap of shows in the given genre (all shows when not set)."""
+        return self.genres.get(genre, 0) if genre else self.all
+    
+    def counts(self, bitmaps: Dict[str, int], base: int) -> Dict[str, int]:
+        """Count how many shows in the base bitmap have each facet value."""
+        return {value: (bitmap & base).bit_count() for value, bitmap in sorted(bitmaps.items())}
+    
+    @staticmethod
+    def ordinals(bitmap: int, skip: int = 0, limit: Optional[int] = None) -> List[int]:
+        """Get set ordinals in ascending order, skipping the first ones."""
+        # Reversed binary string puts ordinal N at index N
+        bits = format(bitmap, "b")[::-1]
+        ordinals = []
+        position = bits.find("1")
+        while position != -1 and (limit is None or len(ordinals) < limit):
+            if skip:
+                skip -= 1
+            else:
+                ordinals.append(position)
+            position = bits.find("1", position + 1)
+        return ordinals
@@ -0,0 +1,55 @@
+"""
+Application-level cache of the genre list.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.models.show import GenreCount
+from app.services.catalog import catalog
+
+
+class GenreCache:
+    """
+    Genres with title counts, aggregated once per catalog generation.
+    
+    The catalog generation only changes when the shows are re-imported, so
+    that is the only time the aggregation runs again.
+    """
+    
+    PIPELINE = [
+        {"$unwind": "$genres"},
+        {"$group": {"_id": "$genres", "count": {"$sum": 1}}},
+        {"$sort": {"_id": 1}}
+    ]
+    
+    def __init__(self):
+        self.generation: Optional[int] = None
+        self.genres: List[GenreCount] = []
+        self.etag: Optional[str] = None
+        self._lock = asyncio.Lock()
+    
+    async def get(self, collection: AsyncIOMotorCollection) -> Tuple[List[GenreCount], str]:
+        """Get the genre counts and their ETag, aggregating on a new generation."""
+        if self.generation != catalog.generation:
+            async with self._lock:
+                generation = catalog.generation
+                if self.generation != generation:
+                    docs = await collection.aggregate(self.PIPELINE).to_list(length=None)
+                    self.genres = [
+                        GenreCount(name=doc["_id"], count=doc["count"])
+                        for doc in docs
+                        if doc["_id"]
+                    ]
+                    payload = json.dumps([genre.model_dump() for genre in self.genres])
+                    self.etag = f'"{hashlib.sha1(payload.encode("utf-8")).hexdigest()}"'
+                    self.generation = generation
+        
+        return self.genres, self.etag
+
+
+genre_cache = GenreCache()
@@ -2,39 +2,43 @@
 IMDB/OMDB service for fetching movie reviews and ratings.
 """
 
-import httpx
+import asyncio
 import os
 from typing import Optional
 from app.config import get_settings
+from app.http_client import get_http_client
 from app.models.show import ShowReviewsResponse, ReviewResponse
+from app.services.omdb_cache import omdb_cache, FetchSkipped
 
 
 class IMDBService:
     """Service for fetching IMDB data via OMDB API."""
     
-    BASE_URL = "http://www.omdbapi.com/"
-    
     def __init__(self):
         # Get API key from settings (loaded fresh to ensure .env is read)
         settings = get_settings()
         self.api_key = settings.omdb_api_key or os.getenv("OMDB_API_KEY", "")
+        self.base_url = settings.omdb_base_url
+        self.deadline = settings.omdb_timeout_seconds
     
-    async def get_movie_reviews(
+    async def fetch_from_omdb(
         self,
         title: str,
-        year: Optional[int] = None
-    ) -> ShowReviewsResponse:
-        """Fetch movie/show reviews from OMDB API."""
+        year: Optional[int] = None,
+        wait: bool = True
+    ) -> Optional[ShowReviewsResponse]:
+        """
+        Fetch a title from the OMDB API.
         
-        if not self.api_key:
-            return ShowReviewsResponse(
-                title=title,
-                reviews=[],
-                imdb_rating=None,
-                imdb_votes=None,
-                metascore=None,
-                poster=None
-            )
+        Returns None if OMDB doesn't know the title and raises on
+        network or API errors. Without wait, raises FetchSkipped instead
+        of queueing when all OMDB request slots are busy.
+        """
+        http = get_http_client()
+        
+        # Nothing awaits between this check and taking the slot below
+        if not wait and http.omdb_limiter.locked():
+            raise FetchSkipped("OMDB request limit reached")
         
         params = {
             "apikey": self.api_key,
@@ -45,48 +49,68 @@ class IMDBService:
         if year:
             params["y"] = str(year)
         
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.BASE_URL, params=params, timeout=10.0)
-                data = response.json()
-                
-                if data.get("Response") == "False":
-                    return ShowReviewsResponse(
-                        title=title,
-                        reviews=[],
-                        imdb_rating=None,
-                        imdb_votes=None,
-                        metascore=None,
-                        poster=None
-                    )
-                
-                # Parse ratings from different sources
-                reviews = []
-                ratings = data.get("Ratings", [])
-                
-                for rating in ratings:
-                    reviews.append(ReviewResponse(
-                        source=rating.get("Source", "Unknown"),
-                        rating=rating.get("Value", "N/A"),
-                        review=None
-                    ))
-                
-                return ShowReviewsResponse(
-                    title=data.get("Title", title),
-                    imdb_rating=data.get("imdbRating"),
-                    imdb_votes=data.get("imdbVotes"),
-                    metascore=data.get("Metascore"),
-                    reviews=reviews,
-                    poster=data.get("Poster") if data.get("Poster") != "N/A" else None
-                )
+        # One deadline covers waiting for a slot and the request itself
+        async with asyncio.timeout(self.deadline):
+            async with http.omdb_limiter:
+                response = await http.client.get(self.base_url, params=params)
+        data = response.json()
+        
+        if data.get("Response") == "False":
+            # Unknown titles are answered normally - anything else is an error
+            if data.get("Error", "").lower().endswith("not found!"):
+                return None
+            raise RuntimeError(data.get("Error", "OMDB request failed"))
+        
+        # Parse ratings from different sources
+        reviews = []
+        ratings = data.get("Ratings", [])
+        
+        for rating in ratings:
+            reviews.append(ReviewResponse(
+                source=rating.get("Source", "Unknown"),
+                rating=rating.get("Value", "N/A"),
+                review=None
+            ))
+        
+        return ShowReviewsResponse(
+            title=data.get("Title", title),
+            imdb_rating=data.get("imdbRating"),
+            imdb_votes=data.get("imdbVotes"),
+            metascore=data.get("Metascore"),
+            reviews=reviews,
+            poster=data.get("Poster") if data.get("Poster") != "N/A" else None
+        )
+    
+    async def get_movie_reviews(
+        self,
+        title: str,
+        year: Optional[int] = None,
+        wait: bool = True
+    ) -> ShowReviewsResponse:
+        """
+        Fetch movie/show reviews, reading through the OMDB cache.
+        
+        Without wait, an uncached title comes back empty instead of queueing
+        when OMDB is saturated.
+        """
+        
+        empty_response = ShowReviewsResponse(
+            title=title,
+            reviews=[],
+            imdb_rating=None,
+            imdb_votes=None,
+            metascore=None,
+            poster=None
+        )
+        
+        if not self.api_key:
+            return empty_response
+        
+        result = await omdb_cache.get(
+            title,
+            year,
+            lambda: self.fetch_from_omdb(title, year, wait),
+            wait
+        )
         
-        except Exception as e:
-            print(f"Error fetching OMDB data: {e}")
-            return ShowReviewsResponse(
-                title=title,
-                reviews=[],
-                imdb_rating=None,
-                imdb_votes=None,
-                metascore=None,
-                poster=None
-            )
+        return result or empty_response
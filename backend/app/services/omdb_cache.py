@@ -0,0 +1,169 @@
+"""
+Cache for OMDB lookups.
+
+Lookups go through a bounded in-process LRU, then a MongoDB-backed store,
+and only then to the OMDB API. Titles OMDB doesn't know are cached too
+(for a shorter time), and concurrent lookups of the same title share a
+single in-flight request.
+"""
+
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.config import get_settings
+from app.database import get_database
+from app.models.show import ShowReviewsResponse
+
+settings = get_settings()
+
+CacheKey = Tuple[str, Optional[int]]
+
+
+class FetchSkipped(Exception):
+    """Raised by a fetch function that chose not to call OMDB (e.g. too busy)."""
+
+
+class OMDBCache:
+    """Read-through cache of OMDB results keyed by (title, year)."""
+    
+    def __init__(self, max_size: int, ttl: timedelta, negative_ttl: timedelta):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # key -> (result or None when OMDB doesn't know the title, expiry)
+        self._entries: "OrderedDict[CacheKey, Tuple[Optional[ShowReviewsResponse], datetime]]" = OrderedDict()
+        # (key, whether the fetch waits for OMDB) -> lookup in progress
+        self._in_flight: Dict[Tuple[CacheKey, bool], asyncio.Task] = {}
+    
+    @staticmethod
+    def make_key(title: str, year: Optional[int]) -> CacheKey:
+        """Normalize a title and year into a cache key."""
+        return " ".join(title.casefold().split()), year
+    
+    @staticmethod
+    def _document_id(key: CacheKey) -> str:
+        title, year = key
+        return f"{title}|{year or ''}"
+    
+    def _remember(self, key: CacheKey, result: Optional[ShowReviewsResponse], expires_at: datetime) -> None:
+        """Put a result in the in-process LRU, evicting the oldest entry if full."""
+        self._entries[key] = (result, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    async def _load_stored(self, key: CacheKey) -> Optional[dict]:
+        """Read a cached result from MongoDB."""
+        db = get_database()
+        if db is None:
+            return None
+        try:
+            return await db.omdb_cache.find_one({"_id": self._document_id(key)})
+        except Exception as e:
+            print(f"⚠️  Could not read OMDB cache: {e}")
+            return None
+    
+    async def _store(self, key: CacheKey, result: Optional[ShowReviewsResponse], expires_at: datetime) -> None:
+        """Write a result to MongoDB so other workers and restarts reuse it."""
+        db = get_database()
+        if db is None:
+            return
+        try:
+            await db.omdb_cache.replace_one(
+                {"_id": self._document_id(key)},
+                {
+                    "found": result is not None,
+                    "data": result.model_dump() if result else None,
+                    "fetched_at": datetime.utcnow(),
+                    "expires_at": expires_at
+                },
+                upsert=True
+            )
+        except Exception as e:
+            print(f"⚠️  Could not write OMDB cache: {e}")
+    
+    async def _load(
+        self,
+        key: CacheKey,
+        fetch: Callable[[], Awaitable[Optional[ShowReviewsResponse]]]
+    ) -> Optional[ShowReviewsResponse]:
+        """Resolve a key from MongoDB or OMDB, falling back to stale data on errors."""
+        now = datetime.utcnow()
+        stale = self._entries.get(key)
+        
+        stored = await self._load_stored(key)
+        if stored:
+            result = ShowReviewsResponse(**stored["data"]) if stored.get("found") else None
+            if stored["expires_at"] > now:
+                self._remember(key, result, stored["expires_at"])
+                return result
+            stale = (result, stored["expires_at"])
+        
+        try:
+            result = await fetch()
+        except FetchSkipped:
+            return stale[0] if stale else None
+        except Exception as e:
+            print(f"Error fetching OMDB data: {e}")
+            # Serve whatever we had rather than nothing - don't cache the failure
+            return stale[0] if stale else None
+        
+        expires_at = now + (self.ttl if result is not None else self.negative_ttl)
+        self._remember(key, result, expires_at)
+        await self._store(key, result, expires_at)
+        return result
+    
+    def peek(self, title: str, year: Optional[int]) -> Tuple[bool, Optional[ShowReviewsResponse]]:
+        """
+        Look a title up in the in-process LRU only, without fetching.
+        
+        Returns whether a fresh entry was found, and its result.
+        """
+        entry = self._entries.get(self.make_key(title, year))
+        if entry and entry[1] > datetime.utcnow():
+            return True, entry[0]
+        return False, None
+    
+    async def get(
+        self,
+        title: str,
+        year: Optional[int],
+        fetch: Callable[[], Awaitable[Optional[ShowReviewsResponse]]],
+        wait: bool = True
+    ) -> Optional[ShowReviewsResponse]:
+        """
+        Get the cached OMDB result for a title, calling fetch on a miss.
+        
+        fetch returns None when OMDB doesn't know the title and raises on
+        errors. Without wait, fetch may also raise FetchSkipped. Returns
+        None for unknown titles.
+        """
+        key = self.make_key(title, year)
+        
+        entry = self._entries.get(key)
+        if entry and entry[1] > datetime.utcnow():
+            self._entries.move_to_end(key)
+            return entry[0]
+        
+        # Share one lookup between concurrent requests for the same title -
+        # but a caller that waits can't join one that may skip OMDB
+        task = self._in_flight.get((key, True))
+        if task is None and not wait:
+            task = self._in_flight.get((key, False))
+        if task is None:
+            flight = (key, wait)
+            task = asyncio.ensure_future(self._load(key, fetch))
+            self._in_flight[flight] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(flight, None))
+        
+        # Shielded so one cancelled request doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+
+omdb_cache = OMDBCache(
+    max_size=settings.omdb_cache_size,
+    ttl=timedelta(hours=settings.omdb_cache_ttl_hours),
+    negative_ttl=timedelta(hours=settings.omdb_negative_ttl_hours)
+)
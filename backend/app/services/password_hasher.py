@@ -0,0 +1,141 @@
+"""
+Password hashing off the event loop.
+
+A bcrypt hash or check burns 100-300 ms of CPU. Run inline, every login
+would stall all other requests on the worker for that long, so they run
+on a small dedicated thread pool instead (bcrypt releases the GIL while
+it works). The pool only queues a bounded number of requests - beyond
+that sign-ins are turned away with a 503 rather than piling up.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException, status
+
+from app.config import get_settings
+from app.utils.helpers import percentile_ms
+from app.utils.security import hash_password, verify_and_update_password
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """Bounded executor for password hashes and checks."""
+    
+    def __init__(self, workers: int, max_waiting: int):
+        self.workers = workers
+        self.max_waiting = max_waiting
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Submitted and not finished - a call cancelled while its hash runs
+        # keeps its slot until the thread is done with it
+        self.in_flight = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        # Seconds spent waiting for a thread, most recent calls
+        self.wait_times: Deque[float] = deque(maxlen=1024)
+        # Counters above change on the pool's threads too
+        self._lock = threading.Lock()
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+    
+    async def _run(self, function: Callable[..., T], *args) -> T:
+        """Run a hashing function on the pool, refusing when the queue is full."""
+        if self.workers <= 0:
+            # Disabled - hash on the event loop (for comparison in benchmarks)
+            return function(*args)
+        
+        if self.in_flight >= self.workers + self.max_waiting:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-ins right now, please try again",
+                headers={"Retry-After": "1"}
+            )
+        
+        queued_at = time.perf_counter()
+        
+        def timed():
+            self.wait_times.append(time.perf_counter() - queued_at)
+            with self._lock:
+                self.running += 1
+            try:
+                return function(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+        
+        with self._lock:
+            self.in_flight += 1
+        try:
+            future = self.executor.submit(timed)
+        except RuntimeError:
+            # Pool shut down
+            with self._lock:
+                self.in_flight -= 1
+            raise
+        future.add_done_callback(self._finished)
+        return await asyncio.wrap_future(future)
+    
+    def _finished(self, future: Future) -> None:
+        """Release a call's slot once the pool is done with it."""
+        with self._lock:
+            self.in_flight -= 1
+            if future.cancelled():
+                self.cancelled += 1
+            elif future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+    
+    async def hash(self, password: str) -> str:
+        """Hash a password at the configured cost."""
+        return await self._run(hash_password, password)
+    
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check a password against its hash.
+        
+        Also returns a new hash when the stored one was made at a different
+        cost (None otherwise), so the caller can upgrade it transparently.
+        """
+        return await self._run(verify_and_update_password, password, hashed_password)
+    
+    def shutdown(self) -> None:
+        """Stop the pool's threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def metrics(self) -> dict:
+        """Queue depth and waiting time for /metrics."""
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "queued": max(self.in_flight - self.running, 0),
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+            "wait_ms_p50": percentile_ms(self.wait_times, 0.5),
+            "wait_ms_p99": percentile_ms(self.wait_times, 0.99)
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_waiting=settings.password_hash_queue_size
+)
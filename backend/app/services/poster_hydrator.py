@@ -0,0 +1,118 @@
+"""
+Background poster hydration.
+
+List endpoints answer with whatever poster and rating a show already has
+and hand the missing ones to this queue, so a slow OMDB never holds up a
+page. A few workers fetch them (through the OMDB cache) and store them on
+the show documents, where the next request picks them up.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Set
+
+from bson import ObjectId
+
+from app.config import get_settings
+from app.database import get_database
+from app.services.imdb_service import IMDBService
+from app.services.omdb_cache import omdb_cache
+
+settings = get_settings()
+
+
+class PosterHydrator:
+    """Bounded, de-duplicated queue of shows waiting for OMDB data."""
+    
+    def __init__(self, workers: int, max_size: int, retry_seconds: int):
+        self.workers = workers
+        self.retry_seconds = retry_seconds
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        # Shows queued or being fetched - each is only queued once
+        self.pending: Set[ObjectId] = set()
+        # Shows OMDB couldn't answer for (e.g. over its daily limit) -> when
+        # to try again; until then they're listed without a poster
+        self.failed: Dict[ObjectId, float] = {}
+        self._tasks: List[asyncio.Task] = []
+    
+    def enqueue(self, show: dict) -> bool:
+        """
+        Queue a show for hydration unless it already is.
+        
+        Returns whether the show is waiting for hydration (False when the
+        queue is full - it gets another chance next time it is listed - or
+        while a failed fetch is backing off).
+        """
+        if show["_id"] in self.pending:
+            return True
+        retry_at = self.failed.get(show["_id"])
+        if retry_at is not None:
+            if retry_at > time.monotonic():
+                return False
+            del self.failed[show["_id"]]
+        try:
+            self.queue.put_nowait(show)
+        except asyncio.QueueFull:
+            return False
+        self.pending.add(show["_id"])
+        return True
+    
+    async def _hydrate(self, imdb_service: IMDBService, show: dict) -> None:
+        """Fetch one show from OMDB and store the result on its document."""
+        title = show.get("title", "")
+        year = show.get("release_year")
+        await imdb_service.get_movie_reviews(title=title, year=year)
+        
+        # Errors aren't cached - try those shows again after a delay
+        known, result = omdb_cache.peek(title, year)
+        if not known:
+            self._back_off(show)
+            return
+        db = get_database()
+        if db is None:
+            return
+        
+        await db.shows.update_one(
+            {"_id": show["_id"]},
+            {"$set": {
+                "omdb_poster": result.poster if result else None,
+                "omdb_rating": result.imdb_rating if result else None,
+                "omdb_fetched": True
+            }}
+        )
+    
+    def _back_off(self, show: dict) -> None:
+        """Don't queue a show again until the retry delay has passed."""
+        self.failed[show["_id"]] = time.monotonic() + self.retry_seconds
+    
+    async def _worker(self) -> None:
+        imdb_service = IMDBService()
+        while True:
+            show = await self.queue.get()
+            try:
+                await self._hydrate(imdb_service, show)
+            except Exception as e:
+                self._back_off(show)
+                print(f"⚠️  Could not hydrate poster for {show.get('title')}: {e}")
+            finally:
+                self.pending.discard(show["_id"])
+                self.queue.task_done()
+    
+    def start(self) -> None:
+        """Start the hydration workers."""
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        print(f"🖼️  Started {self.workers} poster hydration workers")
+    
+    async def stop(self) -> None:
+        """Stop the workers, dropping anything still queued."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+poster_hydrator = PosterHydrator(
+    workers=settings.poster_hydration_workers,
+    max_size=settings.poster_queue_size,
+    retry_seconds=settings.poster_retry_seconds
+)
@@ -0,0 +1,202 @@
+"""
+Rate limiting for the authentication endpoints.
+
+Login and registration are the most expensive requests (bcrypt plus a
+users lookup), so each is limited per client IP and per email before any of that work
+starts. Limits use a sliding window
+counter: the previous window's count, weighted by how much of it still
+overlaps the sliding window, plus the current window's count. Counts
+live in a per-worker dict by default, or in Redis so every worker
+enforces the same limits.
+"""
+
+import ipaddress
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# Counts for one key: (previous window count, current window count,
+# seconds into the current window)
+Counts = Tuple[int, int, float]
+
+
+class Limit(NamedTuple):
+    """At most limit requests per window seconds for each value of a key (0 = no limit)."""
+    name: str
+    value: str
+    limit: int
+    window: int
+
+
+class MemoryBackend:
+    """Window counts per key in a bounded in-process dict (per worker)."""
+    
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # key -> [window number, previous count, current count]
+        self._windows: "OrderedDict[str, List[int]]" = OrderedDict()
+    
+    async def hit(self, key: str, window: int) -> Counts:
+        now = time.time()
+        number = int(now // window)
+        entry = self._windows.get(key)
+        if entry is None or entry[0] < number - 1:
+            entry = [number, 0, 0]
+        elif entry[0] == number - 1:
+            entry = [number, entry[2], 0]
+        entry[2] += 1
+        
+        self._windows[key] = entry
+        self._windows.move_to_end(key)
+        while len(self._windows) > self.max_keys:
+            self._windows.popitem(last=False)
+        return entry[1], entry[2], now - number * window
+
+
+class RedisBackend:
+    """Window counts in Redis, shared by every worker (needs the redis package)."""
+    
+    def __init__(self, url: str, prefix: str = "fletnix:ratelimit:"):
+        import redis.asyncio as redis
+        
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+    
+    async def hit(self, key: str, window: int) -> Counts:
+        now = time.time()
+        number = int(now // window)
+        current_key = f"{self.prefix}{key}:{number}"
+        
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.incr(current_key)
+        pipeline.expire(current_key, 2 * window)
+        pipeline.get(f"{self.prefix}{key}:{number - 1}")
+        current, _, previous = await pipeline.execute()
+        return int(previous or 0), int(current), now - number * window
+
+
+class RateLimiter:
+    """Sliding window limits that answer 429 with Retry-After."""
+    
+    def __init__(self, backend):
+        self.backend = backend
+        self.allowed = 0
+        self.rejected: Dict[str, int] = {}
+    
+    async def _retry_after(self, limit: Limit) -> Optional[int]:
+        """Count a request; returns seconds to wait if it is over the limit."""
+        previous, current, elapsed = await self.backend.hit(f"{limit.name}:{limit.value}", limit.window)
+        overlap = (limit.window - elapsed) / limit.window
+        if previous * overlap + current <= limit.limit:
+            return None
+        
+        if current > limit.limit:
+            # Over on this window alone - wait for the next one
+            return math.ceil(limit.window - elapsed)
+        # Wait until enough of the previous window has slid out
+        excess = previous * overlap + current - limit.limit
+        return max(1, math.ceil(excess / previous * limit.window))
+    
+    async def check(self, limits: List[Limit]) -> None:
+        """Count a request against each limit, raising 429 if any is exceeded."""
+        waits = []
+        for limit in limits:
+            if limit.limit <= 0:
+                # Switched off (e.g. for the test suite)
+                continue
+            try:
+                wait = await self._retry_after(limit)
+            except Exception as e:
+                # A shared backend being down shouldn't lock everyone out
+                print(f"⚠️  Rate limiter unavailable: {e}")
+                continue
+            if wait is not None:
+                self.rejected[limit.name] = self.rejected.get(limit.name, 0) + 1
+                waits.append(wait)
+        
+        if waits:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many attempts, please try again later",
+                headers={"Retry-After": str(max(waits))}
+            )
+        self.allowed += 1
+    
+    async def check_login(self, request: Request, email: str) -> None:
+        """Limit login attempts per client IP and per email."""
+        await self.check([
+            Limit("login_ip", client_ip(request), settings.login_rate_limit_per_ip, settings.rate_limit_window_seconds),
+            Limit("login_email", email.strip().casefold(), settings.login_rate_limit_per_email, settings.rate_limit_window_seconds)
+        ])
+    
+    async def check_register(self, request: Request, email: str) -> None:
+        """Limit registrations per client IP and per email."""
+        await self.check([
+            Limit("register_ip", client_ip(request), settings.register_rate_limit_per_ip, settings.rate_limit_window_seconds),
+            Limit("register_email", email.strip().casefold(), settings.register_rate_limit_per_email, settings.rate_limit_window_seconds)
+        ])
+    
+    def metrics(self) -> dict:
+        """Allowed and rejected counts for /metrics."""
+        return {"allowed": self.allowed, "rejected": dict(self.rejected)}
+
+
+_warned_untrusted_proxy = False
+
+
+def _is_private(address: str) -> bool:
+    try:
+        return ipaddress.ip_address(address).is_private
+    except ValueError:
+        return False
+
+
+def _trusts_forwarded_for(peer: str) -> bool:
+    """Whether X-Forwarded-For from this peer holds the client's IP."""
+    global _warned_untrusted_proxy
+    
+    if settings.trust_forwarded_for is None:
+        return _is_private(peer)
+    if (
+        not settings.trust_forwarded_for
+        and settings.environment == "production"
+        and _is_private(peer)
+        and not _warned_untrusted_proxy
+    ):
+        _warned_untrusted_proxy = True
+        print(
+            f"⚠️  Requests come through a proxy ({peer}) but TRUST_FORWARDED_FOR=false - "
+            "every client shares one per-IP rate limit"
+        )
+    return settings.trust_forwarded_for
+
+
+def client_ip(request: Request) -> str:
+    """The client's IP, taken from X-Forwarded-For when behind a trusted proxy."""
+    peer = request.client.host if request.client else "unknown"
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded and _trusts_forwarded_for(peer):
+        # Our proxy appends the address it saw - anything before it
+        # came from the client and can be made up
+        return forwarded.split(",")[-1].strip()
+    return peer
+
+
+def _create_backend():
+    """Use Redis when configured and available, else per-worker counts."""
+    if settings.rate_limit_redis_url:
+        try:
+            return RedisBackend(settings.rate_limit_redis_url)
+        except ImportError:
+            print("⚠️  Rate limiter needs the redis package for a shared backend - using memory")
+    return MemoryBackend(settings.rate_limit_max_keys)
+
+
+rate_limiter = RateLimiter(_create_backend())
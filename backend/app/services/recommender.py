@@ -0,0 +1,74 @@
+"""
+In-memory recommendation candidates.
+
+For every genre the catalog keeps the ordinals of the shows in it, once
+for everyone and once without adult ratings for users under 18, so a
+recommendation is a weighted sample over a few precomputed arrays and
+never a collection scan.
+"""
+
+import heapq
+import random
+from array import array
+from collections import defaultdict
+from typing import Dict, List
+
+from app.services.facets import FacetIndex
+
+
+class RecommendationIndex:
+    """Per-genre arrays of candidate ordinals, split by age rating."""
+    
+    def __init__(self):
+        self.everyone: array = array("I")
+        self.minors: array = array("I")
+        self.genres: Dict[str, array] = {}
+        self.genres_minors: Dict[str, array] = {}
+    
+    def build(self, facets: FacetIndex) -> None:
+        """Build the candidate arrays from the catalog's facet bitmaps."""
+        allowed_minors = facets.rating_mask(user_age=0)
+        
+        self.everyone = array("I", FacetIndex.ordinals(facets.all))
+        self.minors = array("I", FacetIndex.ordinals(allowed_minors))
+        self.genres = {
+            genre: array("I", FacetIndex.ordinals(bitmap))
+            for genre, bitmap in facets.genres.items()
+        }
+        self.genres_minors = {
+            genre: array("I", FacetIndex.ordinals(bitmap & allowed_minors))
+            for genre, bitmap in facets.genres.items()
+        }
+    
+    def sample(
+        self,
+        weights: Dict[str, float],
+        limit: int,
+        minor: bool = False,
+        rng: random.Random = random
+    ) -> List[int]:
+        """
+        Draw up to limit distinct ordinals from the user's genres.
+        
+        Each candidate is weighted by the summed weight of the user's genres
+        it is in, so shows matching several favourite genres come up more
+        often. Without weights, draws uniformly from every eligible show.
+        """
+        if not weights:
+            candidates = self.minors if minor else self.everyone
+            return rng.sample(candidates, min(limit, len(candidates)))
+        
+        genres = self.genres_minors if minor else self.genres
+        scores: Dict[int, float] = defaultdict(float)
+        for genre, weight in weights.items():
+            if weight > 0:
+                for ordinal in genres.get(genre, ()):
+                    scores[ordinal] += weight
+        
+        # Weighted sampling without replacement (Efraimidis-Spirakis): the
+        # limit largest keys of random() ** (1 / weight) are the sample
+        return heapq.nlargest(
+            limit,
+            scores,
+            key=lambda ordinal: rng.random() ** (1.0 / scores[ordinal])
+        )
@@ -0,0 +1,165 @@
+"""
+Response cache for list endpoints.
+
+Stores pre-serialized JSON bytes keyed by the normalized request, with a
+TTL, stale-while-revalidate and a pluggable backend: a per-worker LRU by
+default, or Redis so every worker shares the same hits.
+"""
+
+import asyncio
+import struct
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Set, Tuple
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# Cached value: (serialized response, time it was computed)
+Entry = Tuple[bytes, float]
+
+# Renders a response: (serialized response, whether it may be cached)
+Compute = Callable[[], Awaitable[Tuple[bytes, bool]]]
+
+# Background refreshes in flight - the event loop only keeps weak
+# references to tasks, so an unreferenced one can be collected mid-flight
+_refresh_tasks: Set[asyncio.Task] = set()
+
+
+class MemoryBackend:
+    """In-process LRU bounded by total payload bytes (per worker)."""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[str, Entry]" = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[Entry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+    
+    async def set(self, key: str, entry: Entry, expire_seconds: int) -> None:
+        # A page larger than the whole budget would only evict everything else
+        if len(entry[0]) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous[0])
+        self._entries[key] = entry
+        self.size += len(entry[0])
+        while self.size > self.max_bytes:
+            _, (payload, _) = self._entries.popitem(last=False)
+            self.size -= len(payload)
+
+
+class RedisBackend:
+    """Redis store shared by every worker (needs the redis package)."""
+    
+    # Each value is the computed-at timestamp followed by the payload
+    HEADER = struct.Struct("!d")
+    
+    def __init__(self, url: str, prefix: str = "fletnix:responses:"):
+        import redis.asyncio as redis
+        
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+    
+    async def get(self, key: str) -> Optional[Entry]:
+        value = await self.client.get(self.prefix + key)
+        if value is None:
+            return None
+        (created_at,) = self.HEADER.unpack_from(value)
+        return value[self.HEADER.size:], created_at
+    
+    async def set(self, key: str, entry: Entry, expire_seconds: int) -> None:
+        payload, created_at = entry
+        value = self.HEADER.pack(created_at) + payload
+        await self.client.set(self.prefix + key, value, ex=expire_seconds)
+
+
+class ResponseCache:
+    """
+    Cache of serialized responses with stale-while-revalidate.
+    
+    Entries younger than ttl are served as is. Entries up to stale seconds
+    past that are still served, but trigger one background recompute.
+    """
+    
+    def __init__(self, backend, ttl: int, stale: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.stale = stale
+        self._refreshing: Set[str] = set()
+    
+    async def _compute(self, key: str, compute: Compute) -> bytes:
+        payload, cacheable = await compute()
+        if cacheable:
+            try:
+                await self.backend.set(key, (payload, time.time()), self.ttl + self.stale)
+            except Exception as e:
+                # Shared backend unreachable - still answer the request
+                print(f"⚠️  Response cache write failed: {e}")
+        return payload
+    
+    async def _refresh(self, key: str, compute: Compute) -> None:
+        try:
+            await self._compute(key, compute)
+        except Exception as e:
+            print(f"⚠️  Background refresh of {key} failed: {e}")
+        finally:
+            self._refreshing.discard(key)
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Compute
+    ) -> Tuple[bytes, str]:
+        """
+        Get a cached response, computing it on a miss.
+        
+        Responses compute marks as not cacheable (e.g. still incomplete)
+        are served but not stored.
+        
+        Returns the payload and how it was served: HIT, STALE or MISS.
+        """
+        try:
+            entry = await self.backend.get(key)
+        except Exception as e:
+            print(f"⚠️  Response cache read failed: {e}")
+            entry = None
+        
+        if entry is not None:
+            payload, created_at = entry
+            age = time.time() - created_at
+            if age < self.ttl:
+                return payload, "HIT"
+            if age < self.ttl + self.stale:
+                # Serve stale now, recompute once in the background
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    task = asyncio.create_task(self._refresh(key, compute))
+                    _refresh_tasks.add(task)
+                    task.add_done_callback(_refresh_tasks.discard)
+                return payload, "STALE"
+        
+        return await self._compute(key, compute), "MISS"
+
+
+def _create_backend():
+    """Use Redis when configured and available, else a per-worker LRU."""
+    if settings.response_cache_redis_url:
+        try:
+            return RedisBackend(settings.response_cache_redis_url)
+        except ImportError:
+            print("⚠️  Response cache needs the redis package for a shared backend - using memory")
+    return MemoryBackend(settings.response_cache_max_mb * 1024 * 1024)
+
+
+response_cache = ResponseCache(
+    backend=_create_backend(),
+    ttl=settings.response_cache_ttl_seconds,
+    stale=settings.response_cache_stale_seconds
+)
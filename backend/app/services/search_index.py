@@ -0,0 +1,155 @@
+"""
+In-memory inverted index for searching shows by title, cast and director.
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List
+
+from app.services.facets import bitmap_from_ordinals
+from app.utils.helpers import tokenize
+
+
+class SearchIndex:
+    """
+    Tokenized inverted index over show titles, cast members and directors.
+    
+    Documents are identified by their ordinal - their position in the
+    catalog snapshot - so a sorted list of ordinals is also a list of
+    shows in catalog order.
+    """
+    
+    # How much a token match in each field counts towards the ranking
+    FIELD_WEIGHTS = {"title": 3.0, "director": 2.0, "cast": 1.0}
+    
+    # A prefix match scores less than matching the whole token
+    PREFIX_FACTOR = 0.5
+    
+    # Short tokens typed while searching ("a", "s") expand to thousands of
+    # terms - keep the matches and bitmaps of tokens expanding to at least
+    # this many terms, for the most recent tokens
+    CACHE_MIN_TERMS = 64
+    CACHE_SIZE = 256
+    
+    def __init__(self):
+        # term -> {ordinal: best field weight for that term}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._vocabulary: List[str] = []
+        # token -> (matches, bitmap or None until needed), for broad tokens -
+        # the index never changes once built
+        self._token_cache: "OrderedDict[str, list]" = OrderedDict()
+        # One-character prefix -> bitmap, for the first keystroke of a search
+        self._prefix_bitmaps: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._vocabulary)
+    
+    def build(self, docs: Iterable[dict]) -> None:
+        """Build the index from documents given in ordinal order."""
+        postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        
+        for ordinal, doc in enumerate(docs):
+            for field, weight in self.FIELD_WEIGHTS.items():
+                for term in tokenize(doc.get(field)):
+                    if weight > postings[term].get(ordinal, 0.0):
+                        postings[term][ordinal] = weight
+        
+        self._postings = dict(postings)
+        self._vocabulary = sorted(self._postings)
+        
+        by_first_char: Dict[str, set] = defaultdict(set)
+        for term, term_postings in self._postings.items():
+            by_first_char[term[0]].update(term_postings)
+        self._prefix_bitmaps = {
+            char: bitmap_from_ordinals(ordinals)
+            for char, ordinals in by_first_char.items()
+        }
+    
+    def _expand(self, token: str) -> List[str]:
+        """Get every indexed term that starts with the token."""
+        start = bisect_left(self._vocabulary, token)
+        end = start
+        while end < len(self._vocabulary) and self._vocabulary[end].startswith(token):
+            end += 1
+        return self._vocabulary[start:end]
+    
+    def _cached_token(self, token: str) -> list:
+        """Get the [matches, bitmap] entry of a token, computing the matches."""
+        entry = self._token_cache.get(token)
+        if entry is not None:
+            self._token_cache.move_to_end(token)
+            return entry
+        
+        terms = self._expand(token)
+        matches: Dict[int, float] = {}
+        
+        for term in terms:
+            factor = 1.0 if term == token else self.PREFIX_FACTOR
+            for ordinal, weight in self._postings[term].items():
+                score = weight * factor
+                if score > matches.get(ordinal, 0.0):
+                    matches[ordinal] = score
+        
+        entry = [matches, None]
+        if len(terms) >= self.CACHE_MIN_TERMS:
+            self._token_cache[token] = entry
+            if len(self._token_cache) > self.CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+        return entry
+    
+    def _match_token(self, token: str) -> Dict[int, float]:
+        """Score every document containing a term that starts with the token."""
+        return self._cached_token(token)[0]
+    
+    def _token_bitmap(self, token: str) -> int:
+        """Bitmap of the documents containing a term that starts with the token."""
+        if len(token) == 1:
+            return self._prefix_bitmaps.get(token, 0)
+        entry = self._cached_token(token)
+        if entry[1] is None:
+            entry[1] = bitmap_from_ordinals(entry[0])
+        return entry[1]
+    
+    def bitmap(self, text: str) -> int:
+        """Bitmap of the documents search() finds - cheaper when the order isn't needed."""
+        tokens = tokenize(text)
+        if not tokens:
+            return 0
+        
+        bitmap = -1
+        for token in dict.fromkeys(tokens):
+            bitmap &= self._token_bitmap(token)
+            if not bitmap:
+                return 0
+        return bitmap
+    
+    def search(self, text: str, ranked: bool = False) -> List[int]:
+        """
+        Find documents where every query token prefix-matches a term.
+        
+        Returns ordinals in ascending (catalog) order, or by descending
+        relevance when ranked is set.
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return []
+        
+        scores: Dict[int, float] = {}
+        for i, token in enumerate(dict.fromkeys(tokens)):
+            matches = self._match_token(token)
+            if i == 0:
+                scores = matches
+            else:
+                scores = {
+                    ordinal: score + matches[ordinal]
+                    for ordinal, score in scores.items()
+                    if ordinal in matches
+                }
+            if not scores:
+                return []
+        
+        # Sorting is stable, so ties stay in ordinal order
+        ordinals = sorted(scores)
+        if ranked:
+            return sorted(ordinals, key=scores.__getitem__, reverse=True)
+        return ordinals
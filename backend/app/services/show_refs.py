@@ -0,0 +1,134 @@
+"""
+Resolution of show identifiers.
+
+Shows are addressed either by their MongoDB _id (24 hex characters) or
+by their dataset show_id ("s123"). The format is classified up front so
+every lookup is a single query on the right field, and the _id and
+genres of recently resolved shows are kept in a bounded LRU, so hot
+paths like tracking a view usually skip the shows collection entirely.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.config import get_settings
+from app.services.catalog import catalog
+from app.utils.helpers import parse_genres
+
+settings = get_settings()
+
+
+class ShowRef(NamedTuple):
+    """What write paths need to know about a show."""
+    object_id: ObjectId
+    show_id: str
+    genres: List[str]
+
+
+def show_filter(identifier: str) -> dict:
+    """Query matching a show by _id or show_id, whichever the identifier is."""
+    if ObjectId.is_valid(identifier) and len(identifier) == 24:
+        return {"_id": ObjectId(identifier)}
+    return {"show_id": identifier}
+
+
+class ShowRefCache:
+    """
+    Bounded LRU of identifier -> ShowRef.
+    
+    Each show is cached under both of its identifiers. A re-import can
+    add or remove shows or change their genres, so the cache starts over
+    on every catalog generation.
+    """
+    
+    PROJECTION = {"show_id": 1, "genres": 1, "listed_in": 1}
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.generation: Optional[int] = None
+        self._entries: "OrderedDict[str, ShowRef]" = OrderedDict()
+    
+    def _check_generation(self) -> None:
+        if self.generation != catalog.generation:
+            self._entries.clear()
+            self.generation = catalog.generation
+    
+    def get(self, identifier: str) -> Optional[ShowRef]:
+        """Look up a cached show without touching MongoDB."""
+        self._check_generation()
+        ref = self._entries.get(identifier)
+        if ref is not None:
+            self._entries.move_to_end(identifier)
+        return ref
+    
+    def remember(self, show: dict) -> ShowRef:
+        """Cache a show document (needs _id, show_id and genres or listed_in)."""
+        self._check_generation()
+        ref = ShowRef(
+            object_id=show["_id"],
+            show_id=show.get("show_id", ""),
+            genres=show.get("genres") or parse_genres(show.get("listed_in", ""))
+        )
+        for key in (str(ref.object_id), ref.show_id):
+            if key:
+                self._entries[key] = ref
+                self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return ref
+    
+    async def resolve(self, collection: AsyncIOMotorCollection, identifier: str) -> Optional[ShowRef]:
+        """Get a show's ref, reading it from MongoDB on a miss; None if there is no such show."""
+        ref = self.get(identifier)
+        if ref is not None:
+            return ref
+        
+        show = await collection.find_one(show_filter(identifier), self.PROJECTION)
+        return self.remember(show) if show else None
+    
+    async def resolve_many(
+        self,
+        collection: AsyncIOMotorCollection,
+        identifiers: Iterable[str]
+    ) -> Dict[str, ShowRef]:
+        """Resolve several identifiers with at most one query; unknown ones are left out."""
+        refs: Dict[str, ShowRef] = {}
+        missing = []
+        for identifier in identifiers:
+            ref = self.get(identifier)
+            if ref is not None:
+                refs[identifier] = ref
+            else:
+                missing.append(identifier)
+        
+        if missing:
+            object_ids, show_ids = [], []
+            for identifier in missing:
+                query = show_filter(identifier)
+                if "_id" in query:
+                    object_ids.append(query["_id"])
+                else:
+                    show_ids.append(identifier)
+            
+            clauses = []
+            if object_ids:
+                clauses.append({"_id": {"$in": object_ids}})
+            if show_ids:
+                clauses.append({"show_id": {"$in": show_ids}})
+            query = clauses[0] if len(clauses) == 1 else {"$or": clauses}
+            
+            found = {}
+            async for show in collection.find(query, self.PROJECTION):
+                ref = self.remember(show)
+                found[str(ref.object_id)] = found[ref.show_id] = ref
+            for identifier in missing:
+                if identifier in found:
+                    refs[identifier] = found[identifier]
+        
+        return refs
+
+
+show_refs = ShowRefCache(settings.show_ref_cache_size)
@@ -2,67 +2,247 @@
 Show service for movie/TV show operations.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from datetime import datetime
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import HTTPException, status
+from pymongo import ReturnDocument
 import asyncio
+import re
 
 from app.models.show import (
     ShowResponse,
-    ShowListResponse,
+    ShowSummary,
     ShowDetailResponse,
-    RecommendationResponse
+    GenreCount
 )
-from app.utils.helpers import parse_genres, is_adult_rating, calculate_pages
+from app.utils.helpers import (
+    parse_genres,
+    split_list,
+    is_adult_rating,
+    calculate_pages,
+    encode_cursor,
+    decode_cursor,
+    tokenize
+)
+from app.config import get_settings
 from app.services.imdb_service import IMDBService
+from app.services.omdb_cache import omdb_cache
+from app.services.poster_hydrator import poster_hydrator
+from app.services.catalog import catalog
+from app.services.genre_cache import genre_cache
+from app.services.affinity import (
+    affinity_update,
+    rescale,
+    view_era,
+    view_increments,
+    weakest_genres,
+    without_genres,
+    top_genres
+)
+from app.services.similarity import similarity_index
+from app.services.show_refs import ShowRef, show_filter, show_refs
+from app.services.user_cache import user_cache
+from app.services.view_buffer import merge_increments, view_buffer
+from app.services.facets import ADULT_RATINGS, KIDS_RATINGS
+
+settings = get_settings()
 
 
 class ShowService:
     """Service class for show operations."""
     
+    # Fields list responses are built from
+    LIST_PROJECTION = {
+        "show_id": 1,
+        "type": 1,
+        "title": 1,
+        "director": 1,
+        "cast": 1,
+        "country": 1,
+        "date_added": 1,
+        "date_added_parsed": 1,
+        "release_year": 1,
+        "rating": 1,
+        "duration": 1,
+        "listed_in": 1,
+        "description": 1,
+        "omdb_poster": 1,
+        "omdb_rating": 1,
+        "omdb_fetched": 1
+    }
+    
+    # What list responses return, and the lean view (view=summary) - what
+    # a show card shows
+    SHOW_FIELDS = list(ShowResponse.model_fields)
+    SUMMARY_FIELDS = list(ShowSummary.model_fields)
+    
+    # Response fields that come from OMDB
+    OMDB_FIELDS = {"poster", "imdb_rating"}
+    NO_OMDB_DATA = {"poster": None, "imdb_rating": None, "pending": False}
+    
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self.collection = db.shows
         self.users_collection = db.users
         self.imdb_service = IMDBService()
     
-    async def _fetch_omdb_data(self, show: dict) -> dict:
-        """Fetch OMDB data for a show and cache it."""
+    def _store_omdb_data(self, show: dict, poster: Optional[str], imdb_rating: Optional[str]) -> None:
+        """Cache OMDB data on the show document (fire and forget)."""
+        asyncio.create_task(
+            self.collection.update_one(
+                {"_id": show["_id"]},
+                {"$set": {
+                    "omdb_poster": poster,
+                    "omdb_rating": imdb_rating,
+                    "omdb_fetched": True
+                }}
+            )
+        )
+    
+    def _cached_omdb_data(self, show: dict) -> Optional[dict]:
+        """
+        Get OMDB data for a show without waiting on OMDB.
+        
+        In background mode an uncached show is queued for hydration and
+        comes back without a poster, marked pending. Otherwise returns
+        None when the show has to be fetched.
+        """
         # Check if we already have cached OMDB data
         if show.get("omdb_poster") or show.get("omdb_fetched"):
             return {
                 "poster": show.get("omdb_poster"),
-                "imdb_rating": show.get("omdb_rating")
+                "imdb_rating": show.get("omdb_rating"),
+                "pending": False
             }
         
-        # Fetch from OMDB
+        if not self.imdb_service.api_key:
+            return self.NO_OMDB_DATA
+        
+        if not settings.poster_hydration_background:
+            return None
+        
+        # Another request may already have fetched it
+        known, omdb_data = omdb_cache.peek(show.get("title", ""), show.get("release_year"))
+        if known:
+            poster = omdb_data.poster if omdb_data else None
+            imdb_rating = omdb_data.imdb_rating if omdb_data else None
+            self._store_omdb_data(show, poster, imdb_rating)
+            return {"poster": poster, "imdb_rating": imdb_rating, "pending": False}
+        
+        return {
+            "poster": None,
+            "imdb_rating": None,
+            "pending": poster_hydrator.enqueue(show)
+        }
+    
+    async def _fetch_omdb_data(self, show: dict) -> dict:
+        """Fetch OMDB data for a show and cache it."""
         try:
+            # Lists skip posters rather than queue when OMDB is saturated
             omdb_data = await self.imdb_service.get_movie_reviews(
                 title=show.get("title", ""),
-                year=show.get("release_year")
+                year=show.get("release_year"),
+                wait=False
             )
             
-            # Cache the data in the database (fire and forget)
             if omdb_data.poster or omdb_data.imdb_rating:
-                asyncio.create_task(
-                    self.collection.update_one(
-                        {"_id": show["_id"]},
-                        {"$set": {
-                            "omdb_poster": omdb_data.poster,
-                            "omdb_rating": omdb_data.imdb_rating,
-                            "omdb_fetched": True
-                        }}
-                    )
-                )
+                self._store_omdb_data(show, omdb_data.poster, omdb_data.imdb_rating)
             
             return {
                 "poster": omdb_data.poster,
-                "imdb_rating": omdb_data.imdb_rating
+                "imdb_rating": omdb_data.imdb_rating,
+                "pending": False
             }
         except Exception as e:
             print(f"Error fetching OMDB data: {e}")
-            return {"poster": None, "imdb_rating": None}
+            return self.NO_OMDB_DATA
+    
+    @classmethod
+    def resolve_fields(cls, view: str = "full", fields: Optional[str] = None) -> Optional[List[str]]:
+        """
+        Get the response fields a list request asks for (None for all).
+        
+        An explicit comma-separated fields list wins over the view.
+        """
+        if fields:
+            requested = split_list(fields)
+            unknown = [field for field in requested if field not in ShowResponse.model_fields]
+            if unknown:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown fields: {', '.join(unknown)}"
+                )
+            return sorted(set(requested) | {"id"})
+        
+        if view == "summary":
+            return list(cls.SUMMARY_FIELDS)
+        
+        return None
+    
+    def _list_projection(self, fields: Optional[List[str]] = None) -> dict:
+        """MongoDB projection for the documents behind the given response fields."""
+        if fields is None:
+            return self.LIST_PROJECTION
+        
+        # The cursor is built from the sort key whatever the fields
+        projection = {"date_added_parsed": 1}
+        for field in fields:
+            if field in self.OMDB_FIELDS:
+                # Looking a show up on OMDB takes its title and year
+                projection.update({
+                    "title": 1,
+                    "release_year": 1,
+                    "omdb_poster": 1,
+                    "omdb_rating": 1,
+                    "omdb_fetched": 1
+                })
+            elif field != "id":
+                projection[field] = 1
+        return projection
+    
+    @staticmethod
+    def _show_dict(show: dict, omdb_data: dict, fields: List[str]) -> dict:
+        """Map a show document to the given response fields, as plain JSON data."""
+        values = {
+            "id": str(show["_id"]),
+            "show_id": show.get("show_id", ""),
+            "type": show.get("type", ""),
+            "title": show.get("title", ""),
+            "poster": omdb_data["poster"],
+            "imdb_rating": omdb_data["imdb_rating"]
+        }
+        return {field: values[field] if field in values else show.get(field) for field in fields}
+    
+    async def _build_show_responses(
+        self,
+        shows: List[dict],
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[dict], bool]:
+        """
+        Build list responses for shows, with their OMDB data.
+        
+        Shows come back as plain dicts shaped like ShowResponse (or just
+        the given fields), ready to encode - nothing validates them twice.
+        OMDB is skipped when fields leaves out the poster and rating.
+        Returns the responses and whether any posters are still pending.
+        """
+        if fields is None or not self.OMDB_FIELDS.isdisjoint(fields):
+            omdb = [self._cached_omdb_data(show) for show in shows]
+            
+            # Fetch OMDB data for the rest in parallel
+            missing = [i for i, omdb_data in enumerate(omdb) if omdb_data is None]
+            if missing:
+                fetched = await asyncio.gather(*[self._fetch_omdb_data(shows[i]) for i in missing])
+                for i, omdb_data in zip(missing, fetched):
+                    omdb[i] = omdb_data
+        else:
+            omdb = [self.NO_OMDB_DATA] * len(shows)
+        
+        fields = fields or self.SHOW_FIELDS
+        responses = [self._show_dict(show, omdb_data, fields) for show, omdb_data in zip(shows, omdb)]
+        return responses, any(omdb_data["pending"] for omdb_data in omdb)
     
     async def get_shows(
         self,
@@ -72,9 +252,104 @@ class ShowService:
         search: Optional[str] = None,
         genre: Optional[str] = None,
         user_age: Optional[int] = None,
-        kids_mode: bool = False
-    ) -> ShowListResponse:
-        """Get paginated list of shows with filters."""
+        kids_mode: bool = False,
+        ranked: bool = False,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> dict:
+        """
+        Get paginated list of shows with filters, shaped like ShowListResponse.
+        
+        With a cursor (from a previous page's next_cursor) the page starts
+        right after that show instead of skipping page - 1 pages, and
+        results are always in date order.
+        
+        With fields (see resolve_fields) only those show fields are read
+        from MongoDB; the others are left empty.
+        """
+        
+        # Nothing to search for (e.g. only whitespace) lists everything
+        if search is not None and not tokenize(search):
+            search = None
+        
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+            ranked = False
+        
+        # Calculate skip
+        skip = 0 if after else (page - 1) * limit
+        
+        facets = None
+        if catalog.ready:
+            # Filters, counts and ordering all resolve in memory - MongoDB
+            # is only asked for the documents on this page
+            selection = catalog.select(
+                skip=skip,
+                limit=limit,
+                start=catalog.position_after(*after) if after else 0,
+                show_type=show_type,
+                search=search,
+                genre=genre,
+                user_age=user_age,
+                kids_mode=kids_mode,
+                ranked=ranked
+            )
+            shows = await self._find_by_ids(selection.ids, self._list_projection(fields))
+            total = selection.total
+            has_more = selection.has_more
+            facets = selection.facets
+        else:
+            shows, total, has_more = await self._query_shows(
+                skip, limit, show_type, search, genre, user_age, kids_mode, after,
+                self._list_projection(fields)
+            )
+        
+        show_responses, posters_pending = await self._build_show_responses(shows, fields)
+        
+        total_pages = calculate_pages(total, limit)
+        
+        # Relevance order has no stable position to continue from
+        next_cursor = None
+        if has_more and shows and not ranked:
+            last = shows[-1]
+            next_cursor = encode_cursor(last.get("date_added_parsed"), last["_id"])
+        
+        return {
+            "shows": show_responses,
+            "total": total,
+            "page": page,
+            "pages": total_pages,
+            "has_next": has_more if after else page < total_pages,
+            "has_prev": after is not None or page > 1,
+            "facets": facets,
+            "next_cursor": next_cursor,
+            "posters_pending": posters_pending
+        }
+    
+    async def _query_shows(
+        self,
+        skip: int,
+        limit: int,
+        show_type: Optional[str] = None,
+        search: Optional[str] = None,
+        genre: Optional[str] = None,
+        user_age: Optional[int] = None,
+        kids_mode: bool = False,
+        after: Optional[Tuple[Optional[datetime], ObjectId]] = None,
+        projection: Optional[dict] = None
+    ) -> Tuple[List[dict], int, bool]:
+        """
+        Get a page of shows straight from MongoDB.
+        
+        Returns the shows, the total count and whether more shows follow.
+        """
         
         # Build query
         query = {}
@@ -83,93 +358,104 @@ class ShowService:
         if show_type:
             query["type"] = show_type
         
-        # Search by title or cast (using regex for compatibility without text index)
-        if search:
-            query["$or"] = [
-                {"title": {"$regex": search, "$options": "i"}},
-                {"cast": {"$regex": search, "$options": "i"}},
-                {"director": {"$regex": search, "$options": "i"}}
+        # Search title, cast and director like the catalog's search index:
+        # every token must start a word in one of them
+        tokens = list(dict.fromkeys(tokenize(search)))
+        if tokens:
+            query["$and"] = [
+                {"$or": [
+                    {field: {"$regex": rf"\b{re.escape(token)}", "$options": "i"}}
+                    for field in ("title", "cast", "director")
+                ]}
+                for token in tokens
             ]
         
-        # Filter by genre
+        # Filter by genre (exact match on the multikey genres index)
         if genre:
-            query["listed_in"] = {"$regex": genre, "$options": "i"}
+            query["genres"] = genre
         
         # Age restriction - users under 18 should not see R-rated content
         if user_age is not None and user_age < 18:
-            query["rating"] = {"$nin": ["R", "NC-17", "TV-MA"]}
+            query["rating"] = {"$nin": ADULT_RATINGS}
         
         # Kids mode - filter out all adult/mature content
         if kids_mode:
-            query["rating"] = {"$in": ["G", "TV-G", "TV-Y", "TV-Y7", "TV-Y7-FV", "PG", "TV-PG"]}
-        
-        # Calculate skip
-        skip = (page - 1) * limit
-        
-        # Get total count
-        total = await self.collection.count_documents(query)
-        
-        # Get shows sorted by date_added_parsed (newest first)
-        cursor = self.collection.find(query).sort("date_added_parsed", -1).skip(skip).limit(limit)
-
-        shows = await cursor.to_list(length=limit)
-        
-        # Fetch OMDB data for shows (in parallel, limited to prevent rate limiting)
-        async def get_show_with_omdb(show):
-            omdb_data = await self._fetch_omdb_data(show)
-            return ShowResponse(
-                id=str(show["_id"]),
-                show_id=show.get("show_id", ""),
-                type=show.get("type", ""),
-                title=show.get("title", ""),
-                director=show.get("director"),
-                cast=show.get("cast"),
-                country=show.get("country"),
-                date_added=show.get("date_added"),
-                release_year=show.get("release_year"),
-                rating=show.get("rating"),
-                duration=show.get("duration"),
-                listed_in=show.get("listed_in"),
-                description=show.get("description"),
-                poster=omdb_data.get("poster"),
-                imdb_rating=omdb_data.get("imdb_rating")
+            query["rating"] = {"$in": KIDS_RATINGS}
+        
+        # Only the fields list responses use (and the cursor needs)
+        page_stages = [
+            {"$skip": skip},
+            {"$limit": limit + 1},
+            {"$project": projection or self.LIST_PROJECTION}
+        ]
+        
+        if after:
+            # Seek past the cursor position on the (date_added_parsed, _id)
+            # index - inside $facet the seek couldn't use it, so the page and
+            # the count go as two queries, in parallel
+            date_added, object_id = after
+            seek = [{"date_added_parsed": date_added, "_id": {"$lt": object_id}}]
+            if date_added is not None:
+                seek.append({"date_added_parsed": {"$lt": date_added}})
+                # Shows without a date sort last
+                seek.append({"date_added_parsed": None})
+            page_query = {"$and": [query, {"$or": seek}]}
+            shows, total = await asyncio.gather(
+                self.collection.aggregate(
+                    [{"$match": page_query}, {"$sort": dict(catalog.SORT)}] + page_stages
+                ).to_list(length=limit + 1),
+                self.collection.count_documents(query)
             )
-        
-        # Fetch OMDB data for all shows in parallel
-        show_responses = await asyncio.gather(*[get_show_with_omdb(show) for show in shows])
-        
-        # print(show_responses[0])
-        
-        total_pages = calculate_pages(total, limit)
-        
-        return ShowListResponse(
-            shows=list(show_responses),
-            total=total,
-            page=page,
-            pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1
-        )
+        elif not query and settings.estimated_count_unfiltered:
+            # Unfiltered - the total comes from collection metadata
+            shows, total = await asyncio.gather(
+                self.collection.aggregate(
+                    [{"$sort": dict(catalog.SORT)}] + page_stages
+                ).to_list(length=limit + 1),
+                self.collection.estimated_document_count()
+            )
+        else:
+            # One round trip evaluates the filter once for the page and the total
+            result = await self.collection.aggregate([
+                {"$match": query},
+                {"$sort": dict(catalog.SORT)},
+                {"$facet": {
+                    "shows": page_stages,
+                    "total": [{"$count": "count"}]
+                }}
+            ]).to_list(length=1)
+            shows = result[0]["shows"]
+            total = result[0]["total"][0]["count"] if result[0]["total"] else 0
+        
+        # One extra show was fetched to tell whether another page follows
+        return shows[:limit], total, len(shows) > limit
+    
+    async def _find_by_ids(self, ids: List[ObjectId], projection: Optional[dict] = None) -> List[dict]:
+        """Fetch shows by ID, keeping the order of the IDs."""
+        if not ids:
+            return []
+        
+        docs = await self.collection.find(
+            {"_id": {"$in": ids}},
+            projection or self.LIST_PROJECTION
+        ).to_list(length=len(ids))
+        
+        # $in doesn't preserve order - put the shows back in requested order
+        by_id = {doc["_id"]: doc for doc in docs}
+        return [by_id[show_id] for show_id in ids if show_id in by_id]
     
     async def get_show_by_id(self, show_id: str) -> ShowDetailResponse:
         """Get detailed show information by ID."""
         
-        # Try to find by MongoDB _id first, then by show_id
-        show = None
-        
-        try:
-            show = await self.collection.find_one({"_id": ObjectId(show_id)})
-        except:
-            pass
-        
-        if not show:
-            show = await self.collection.find_one({"show_id": show_id})
+        # The ID's format says which field to match - one query either way
+        show = await self.collection.find_one(show_filter(show_id))
         
         if not show:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Show not found"
             )
+        show_refs.remember(show)
         
         return ShowDetailResponse(
             id=str(show["_id"]),
@@ -185,153 +471,191 @@ class ShowService:
             duration=show.get("duration"),
             listed_in=show.get("listed_in"),
             description=show.get("description"),
-            genres=parse_genres(show.get("listed_in", ""))
+            genres=show.get("genres") or parse_genres(show.get("listed_in", ""))
         )
     
     async def track_view(self, user_id: str, show_id: str) -> None:
         """Track that a user viewed a show (for recommendations)."""
         
-        # Get the show
-        show = await self.get_show_by_id(show_id)
+        # Usually answered from memory - the show was just opened
+        show = await show_refs.resolve(self.collection, show_id)
+        if not show:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Show not found"
+            )
+        
+        await self._record_views(user_id, [show])
+    
+    async def track_views(self, user_id: str, show_ids: List[str]) -> dict:
+        """Track several views at once; unknown shows are reported, not fatal."""
         
-        # Get genres from the show
-        genres = parse_genres(show.listed_in)
+        shows = await show_refs.resolve_many(self.collection, show_ids)
+        found = [shows[show_id] for show_id in show_ids if show_id in shows]
+        await self._record_views(user_id, found)
         
-        if genres:
-            # Add genres to user's viewed_genres (using $addToSet to avoid duplicates)
+        return {
+            "tracked": len(found),
+            "not_found": [show_id for show_id in show_ids if show_id not in shows]
+        }
+    
+    async def _record_views(self, user_id: str, shows: List[ShowRef]) -> None:
+        """Add the views' weight to the user's genre profile in one update."""
+        increments = {}
+        viewed_at = datetime.utcnow()
+        era = view_era(viewed_at)
+        for show in shows:
+            merge_increments(increments, view_increments(show.genres, viewed_at))
+        
+        if not increments:
+            return
+        
+        # Written in the next batch with everyone else's views
+        if view_buffer.running:
+            view_buffer.add(user_id, increments, era, views=len(shows))
+            return
+        
+        user = await self.users_collection.find_one_and_update(
+            {"_id": ObjectId(user_id)},
+            affinity_update(increments, era),
+            projection={"genre_affinity": 1, "affinity_era": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        
+        if not user:
+            user_cache.invalidate(user_id)
+            return
+        
+        # Keep the profile small - drop the weakest genres when it grows
+        affinity = user.get("genre_affinity", {})
+        drop = weakest_genres(affinity, settings.affinity_max_genres)
+        if drop:
             await self.users_collection.update_one(
                 {"_id": ObjectId(user_id)},
-                {"$addToSet": {"viewed_genres": {"$each": genres}}}
+                {"$unset": {f"genre_affinity.{key}": "" for key in drop}}
             )
+        user_cache.set_genre_affinity(user_id, without_genres(affinity, drop), user.get("affinity_era", 0))
     
     async def get_recommendations(
         self,
         user_id: str,
         user_age: Optional[int] = None,
         limit: int = 10
-    ) -> RecommendationResponse:
-        """Get genre-based recommendations for a user."""
-        
-        # Get user's viewed genres
-        user = await self.users_collection.find_one({"_id": ObjectId(user_id)})
+    ) -> dict:
+        """Get genre-based recommendations for a user, shaped like RecommendationResponse."""
+        
+        # Get user's genre profile
+        user = await user_cache.get(self.users_collection, user_id)
+        
+        top_k = settings.recommendation_top_genres
+        # Include views still waiting in the buffer, both scaled to the later era
+        stored_era = user.get("affinity_era", 0) if user else 0
+        era = max(stored_era, view_buffer.era)
+        affinity = merge_increments(
+            rescale(user.get("genre_affinity") or {}, stored_era, era) if user else {},
+            {
+                key.split(".", 1)[1]: weight
+                for key, weight in rescale(view_buffer.pending_for(user_id), view_buffer.era, era).items()
+            }
+        )
+        favourites = top_genres(affinity, top_k) if user else []
+        if not favourites and user and user.get("viewed_genres"):
+            # Profiles from before affinity tracking weigh every genre the same
+            favourites = [(genre, 1.0) for genre in user["viewed_genres"][:top_k]]
         
-        if not user or not user.get("viewed_genres"):
+        if not favourites:
             # Return random shows if no viewing history
             return await self._get_random_recommendations(user_age, limit)
         
-        viewed_genres = user["viewed_genres"]
-        
-        # Build query for recommendations
-        query = {
-            "$or": [
-                {"listed_in": {"$regex": genre, "$options": "i"}}
-                for genre in viewed_genres[:5]  # Use top 5 genres
-            ]
-        }
-        
-        # Age restriction
-        if user_age is not None and user_age < 18:
-            query["rating"] = {"$nin": ["R", "NC-17", "TV-MA"]}
-        
-        # Get recommended shows
-        cursor = self.collection.aggregate([
-            {"$match": query},
-            {"$sample": {"size": limit}}
-        ])
+        based_on_genres = [genre for genre, _ in favourites]
         
-        shows = await cursor.to_list(length=limit)
+        if catalog.ready:
+            # Sampled in memory from the precomputed per-genre candidates
+            ids = catalog.recommend(dict(favourites), limit, user_age)
+            shows = await self._find_by_ids(ids)
+        else:
+            query = {"genres": {"$in": based_on_genres}}
+            
+            # Age restriction
+            if user_age is not None and user_age < 18:
+                query["rating"] = {"$nin": ADULT_RATINGS}
+            
+            # Get recommended shows
+            cursor = self.collection.aggregate([
+                {"$match": query},
+                {"$sample": {"size": limit}},
+                {"$project": self.LIST_PROJECTION}
+            ])
+            shows = await cursor.to_list(length=limit)
         
         # Fetch OMDB data for recommendations
-        async def get_show_with_omdb(show):
-            omdb_data = await self._fetch_omdb_data(show)
-            return ShowResponse(
-                id=str(show["_id"]),
-                show_id=show.get("show_id", ""),
-                type=show.get("type", ""),
-                title=show.get("title", ""),
-                director=show.get("director"),
-                cast=show.get("cast"),
-                country=show.get("country"),
-                date_added=show.get("date_added"),
-                release_year=show.get("release_year"),
-                rating=show.get("rating"),
-                duration=show.get("duration"),
-                listed_in=show.get("listed_in"),
-                description=show.get("description"),
-                poster=omdb_data.get("poster"),
-                imdb_rating=omdb_data.get("imdb_rating")
-            )
-        
-        show_responses = await asyncio.gather(*[get_show_with_omdb(show) for show in shows])
+        show_responses, posters_pending = await self._build_show_responses(shows)
         
-        return RecommendationResponse(
-            shows=list(show_responses),
-            based_on_genres=viewed_genres[:5]
-        )
+        return {
+            "shows": show_responses,
+            "based_on_genres": based_on_genres,
+            "posters_pending": posters_pending
+        }
     
     async def _get_random_recommendations(
         self,
         user_age: Optional[int] = None,
         limit: int = 10
-    ) -> RecommendationResponse:
+    ) -> dict:
         """Get random recommendations when user has no viewing history."""
         
-        query = {}
-        
-        # Age restriction
-        if user_age is not None and user_age < 18:
-            query["rating"] = {"$nin": ["R", "NC-17", "TV-MA"]}
-        
-        cursor = self.collection.aggregate([
-            {"$match": query},
-            {"$sample": {"size": limit}}
-        ])
-        
-        shows = await cursor.to_list(length=limit)
+        if catalog.ready:
+            shows = await self._find_by_ids(catalog.recommend({}, limit, user_age))
+        else:
+            query = {}
+            
+            # Age restriction
+            if user_age is not None and user_age < 18:
+                query["rating"] = {"$nin": ADULT_RATINGS}
+            
+            cursor = self.collection.aggregate([
+                {"$match": query},
+                {"$sample": {"size": limit}},
+                {"$project": self.LIST_PROJECTION}
+            ])
+            shows = await cursor.to_list(length=limit)
         
         # Fetch OMDB data for random recommendations
-        async def get_show_with_omdb(show):
-            omdb_data = await self._fetch_omdb_data(show)
-            return ShowResponse(
-                id=str(show["_id"]),
-                show_id=show.get("show_id", ""),
-                type=show.get("type", ""),
-                title=show.get("title", ""),
-                director=show.get("director"),
-                cast=show.get("cast"),
-                country=show.get("country"),
-                date_added=show.get("date_added"),
-                release_year=show.get("release_year"),
-                rating=show.get("rating"),
-                duration=show.get("duration"),
-                listed_in=show.get("listed_in"),
-                description=show.get("description"),
-                poster=omdb_data.get("poster"),
-                imdb_rating=omdb_data.get("imdb_rating")
-            )
-        
-        show_responses = await asyncio.gather(*[get_show_with_omdb(show) for show in shows])
+        show_responses, posters_pending = await self._build_show_responses(shows)
         
-        return RecommendationResponse(
-            shows=list(show_responses),
-            based_on_genres=[]
-        )
+        return {
+            "shows": show_responses,
+            "based_on_genres": [],
+            "posters_pending": posters_pending
+        }
     
-    async def get_genres(self) -> List[str]:
-        """Get all unique genres from the database."""
+    async def get_similar_shows(
+        self,
+        show_id: str,
+        user_age: Optional[int] = None,
+        kids_mode: bool = False,
+        limit: int = 10
+    ) -> dict:
+        """Get the shows most similar to a show, shaped like SimilarShowsResponse."""
         
-        cursor = self.collection.aggregate([
-            {"$project": {"listed_in": 1}},
-            {"$unwind": {"path": "$listed_in", "preserveNullAndEmptyArrays": False}},
-        ])
+        show = await self.get_show_by_id(show_id)
         
-        # This is a simplified version - in production, you'd want to
-        # split the listed_in field and get unique genres
-        genres_set = set()
+        # Reads the memory-mapped index - keep it off the event loop
+        ids = await asyncio.to_thread(similarity_index.similar, show.id, limit, user_age, kids_mode)
+        if ids is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Similar titles are not available"
+            )
         
-        async for doc in self.collection.find({}, {"listed_in": 1}):
-            if doc.get("listed_in"):
-                for genre in parse_genres(doc["listed_in"]):
-                    genres_set.add(genre)
+        shows = await self._find_by_ids(ids)
+        show_responses, posters_pending = await self._build_show_responses(shows)
         
-        return sorted(list(genres_set))
+        return {
+            "shows": show_responses,
+            "posters_pending": posters_pending
+        }
+    
+    async def get_genre_counts(self) -> Tuple[List[GenreCount], str]:
+        """Get all genres with title counts, and an ETag for the list."""
+        return await genre_cache.get(self.collection)
@@ -0,0 +1,128 @@
+"""
+Content-similarity index for "more like this".
+
+The index is built offline by scripts/build_similarity_index.py: one
+L2-normalized feature vector per show, memory-mapped from disk. It is
+stored feature-major - one row per feature column - and a show has only
+a couple dozen non-zero features, so the cosine similarity of a show to
+every other show reads just those rows instead of the whole matrix. Age
+and kids-mode rules are applied as boolean masks over the shows before
+picking the top k.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from bson import ObjectId
+
+from app.config import get_settings
+from app.services.facets import ADULT_RATINGS, KIDS_RATINGS
+
+settings = get_settings()
+
+
+class SimilarityIndex:
+    """Memory-mapped feature-major show vectors with masked top-k search."""
+    
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.features: Optional[np.ndarray] = None
+        self.ids: Optional[np.ndarray] = None
+        self.rows: Dict[str, int] = {}
+        self.adult: Optional[np.ndarray] = None
+        self.kids: Optional[np.ndarray] = None
+        self._loaded_mtime: Optional[float] = None
+        # Lookups run in worker threads - keep a reload from swapping the
+        # files out from under one
+        self._lock = threading.RLock()
+    
+    @property
+    def ready(self) -> bool:
+        return self.features is not None
+    
+    def _load(self) -> None:
+        """Map the index files from disk."""
+        features = np.load(self.directory / "features.npy", mmap_mode="r")
+        ids = np.load(self.directory / "ids.npy")
+        ratings = np.load(self.directory / "ratings.npy")
+        if not len(ids) == len(ratings) == features.shape[1]:
+            raise ValueError("index files don't match - is a rebuild still running?")
+        
+        self.features = features
+        self.ids = ids
+        self.rows = {object_id: row for row, object_id in enumerate(ids.tolist())}
+        self.adult = np.isin(ratings, ADULT_RATINGS)
+        self.kids = np.isin(ratings, KIDS_RATINGS)
+        print(f"🧭 Loaded similarity index with {len(ids)} shows")
+    
+    def refresh(self) -> bool:
+        """(Re)load the index if its files changed on disk; returns whether it's usable."""
+        with self._lock:
+            try:
+                mtime = os.stat(self.directory / "features.npy").st_mtime
+            except FileNotFoundError:
+                return self.ready
+            
+            if mtime != self._loaded_mtime:
+                try:
+                    self._load()
+                    self._loaded_mtime = mtime
+                except Exception as e:
+                    print(f"⚠️  Could not load similarity index: {e}")
+            return self.ready
+    
+    def top_k(self, row: int, limit: int, allowed: np.ndarray) -> List[int]:
+        """
+        Find the most similar allowed rows to a show's row.
+        
+        Scores the show against every show using only its non-zero
+        feature columns, and returns up to limit rows by descending
+        similarity - never the show itself, and only shows sharing some
+        feature.
+        """
+        vector = np.asarray(self.features[:, row])
+        columns = np.flatnonzero(vector)
+        scores = vector[columns] @ self.features[columns]
+        scores[~allowed] = -np.inf
+        scores[row] = -np.inf
+        
+        k = min(limit, scores.shape[0])
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [int(similar) for similar in best if scores[similar] > 0]
+    
+    def similar(
+        self,
+        object_id: str,
+        limit: int,
+        user_age: Optional[int] = None,
+        kids_mode: bool = False
+    ) -> Optional[List[ObjectId]]:
+        """
+        Get the IDs of the shows most similar to a show.
+        
+        Returns None when there is no index, and an empty list for shows
+        added after it was built. Blocking - call it from a worker thread.
+        """
+        with self._lock:
+            if not self.refresh():
+                return None
+            
+            row = self.rows.get(object_id)
+            if row is None:
+                return []
+            
+            allowed = np.ones(len(self.ids), dtype=bool)
+            if user_age is not None and user_age < 18:
+                allowed &= ~self.adult
+            if kids_mode:
+                allowed &= self.kids
+            
+            rows = self.top_k(row, limit, allowed)
+            return [ObjectId(self.ids[similar]) for similar in rows]
+
+
+similarity_index = SimilarityIndex(settings.similarity_index_dir)
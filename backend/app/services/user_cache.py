@@ -0,0 +1,99 @@
+"""
+Cache of user profiles.
+
+/api/auth/me and recommendations read the same few fields of the user
+document on every call, while the document only changes when views are
+written. Profiles are kept in a per-worker LRU with a TTL, and every
+write to a profile updates or drops the cached copy.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class UserCache:
+    """Bounded LRU of user_id -> (profile fields, expiry timestamp)."""
+    
+    PROJECTION = {
+        "email": 1,
+        "age": 1,
+        "created_at": 1,
+        "genre_affinity": 1,
+        "affinity_era": 1,
+        "viewed_genres": 1
+    }
+    
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+    
+    def _remember(self, user_id: str, user: dict) -> None:
+        self._entries[user_id] = (user, time.time() + self.ttl)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def _cached(self, user_id: str) -> Optional[dict]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return user
+    
+    async def get(self, collection: AsyncIOMotorCollection, user_id: str) -> Optional[dict]:
+        """
+        Get a user's profile fields, reading MongoDB on a miss.
+        
+        The returned document is shared - callers must not modify it.
+        """
+        user = self._cached(user_id)
+        if user is not None:
+            self.hits += 1
+            return user
+        
+        self.misses += 1
+        user = await collection.find_one({"_id": ObjectId(user_id)}, self.PROJECTION)
+        if user is not None:
+            self._remember(user_id, user)
+        return user
+    
+    def set_genre_affinity(self, user_id: str, genre_affinity: Dict[str, float], era: int) -> None:
+        """Replace a cached user's genre profile with what was just written."""
+        user = self._cached(user_id)
+        if user is not None:
+            self._remember(user_id, {**user, "genre_affinity": genre_affinity, "affinity_era": era})
+    
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's cached profile."""
+        self._entries.pop(user_id, None)
+    
+    def metrics(self) -> dict:
+        """Hit and miss counts for /metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None
+        }
+
+
+user_cache = UserCache(
+    max_size=settings.user_cache_size,
+    ttl=settings.user_cache_ttl_seconds
+)
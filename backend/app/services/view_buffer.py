@@ -0,0 +1,192 @@
+"""
+Write-behind buffer for view tracking.
+
+Recording a view only adds its weights to an in-process buffer keyed by
+user, so a burst of views costs no MongoDB writes at request time. The
+buffer is flushed as one unordered bulk_write - a single update per user,
+however many views they made - every few hundred views or every second,
+whichever comes first, and drained on shutdown. Buffered weights are kept
+in one affinity era, rescaled when a view arrives in a later one.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from app.config import get_settings
+from app.database import get_database
+from app.services.affinity import affinity_update, rescale, weakest_genres, without_genres
+from app.services.user_cache import user_cache
+from app.utils.helpers import percentile_ms
+
+settings = get_settings()
+
+Increments = Dict[str, float]
+
+
+class ViewBuffer:
+    """Per-user genre increments waiting to be written."""
+    
+    def __init__(self, flush_size: int, flush_interval: float):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        # user_id -> {"genre_affinity.<genre>": weight}
+        self.pending: Dict[str, Increments] = {}
+        self.era = 0  # Affinity era every pending weight is scaled to
+        self.pending_views = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.flushed_views = 0
+        self.flush_times: Deque[float] = deque(maxlen=256)
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+    
+    def add(self, user_id: str, increments: Increments, era: int, views: int = 1) -> None:
+        """Buffer the increments of a user's views, scaled to the given era."""
+        if era > self.era:
+            self.pending = {
+                pending_id: rescale(pending, self.era, era)
+                for pending_id, pending in self.pending.items()
+            }
+            self.era = era
+        increments = rescale(increments, era, self.era)
+        merge_increments(self.pending.setdefault(user_id, {}), increments)
+        self.pending_views += views
+        if self.pending_views >= self.flush_size:
+            self._wake.set()
+    
+    def pending_for(self, user_id: str) -> Increments:
+        """Increments of a user's views not written yet (so reads can include them), in self.era."""
+        return self.pending.get(user_id, {})
+    
+    async def flush(self) -> int:
+        """Write everything buffered so far; returns the number of views written."""
+        async with self._flush_lock:
+            if not self.pending:
+                return 0
+            db = get_database()
+            if db is None:
+                return 0
+            
+            batch, views, era = self.pending, self.pending_views, self.era
+            self.pending, self.pending_views = {}, 0
+            
+            started = time.perf_counter()
+            try:
+                await db.users.bulk_write(
+                    [
+                        UpdateOne({"_id": ObjectId(user_id)}, affinity_update(increments, era))
+                        for user_id, increments in batch.items()
+                    ],
+                    ordered=False
+                )
+            except Exception as e:
+                # Put the batch back, merged with anything buffered meanwhile
+                for user_id, increments in batch.items():
+                    self.add(user_id, increments, era, views=0)
+                self.pending_views += views
+                self.failed_flushes += 1
+                print(f"⚠️  Could not write {views} buffered views (will retry): {e}")
+                return 0
+            
+            await self._trim_profiles(db, list(batch))
+            self.flush_times.append(time.perf_counter() - started)
+            self.flushes += 1
+            self.flushed_views += views
+            return views
+    
+    async def _trim_profiles(self, db, user_ids: List[str]) -> None:
+        """Drop the weakest genres of profiles that grew past the cap."""
+        try:
+            users = await db.users.find(
+                {"_id": {"$in": [ObjectId(user_id) for user_id in user_ids]}},
+                {"genre_affinity": 1, "affinity_era": 1}
+            ).to_list(length=None)
+            trims = []
+            for user in users:
+                affinity = user.get("genre_affinity") or {}
+                drop = weakest_genres(affinity, settings.affinity_max_genres)
+                if drop:
+                    trims.append(UpdateOne(
+                        {"_id": user["_id"]},
+                        {"$unset": {f"genre_affinity.{key}": "" for key in drop}}
+                    ))
+                # Cached profiles pick up the write without reading it back
+                user_cache.set_genre_affinity(
+                    str(user["_id"]),
+                    without_genres(affinity, drop),
+                    user.get("affinity_era", 0)
+                )
+            if trims:
+                await db.users.bulk_write(trims, ordered=False)
+        except Exception as e:
+            print(f"⚠️  Could not trim genre profiles: {e}")
+            for user_id in user_ids:
+                user_cache.invalidate(user_id)
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            failed_flushes = self.failed_flushes
+            await self.flush()
+            if self.failed_flushes > failed_flushes:
+                # A failed batch goes back into the buffer and wakes the loop
+                # again - wait an interval instead of retrying straight away
+                await asyncio.sleep(self.flush_interval)
+    
+    def start(self) -> None:
+        """Start flushing in the background."""
+        self._task = asyncio.create_task(self._run())
+        print(f"📝 Buffering views (flush every {self.flush_size} views or {self.flush_interval:g}s)")
+    
+    async def stop(self) -> None:
+        """Stop the background flushes and write whatever is left."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        
+        views = self.pending_views
+        await self.flush()
+        if self.pending:
+            print(f"⚠️  Lost {self.pending_views} buffered views on shutdown")
+        elif views:
+            print(f"📝 Wrote {views} buffered views on shutdown")
+    
+    def metrics(self) -> dict:
+        """Queue depth and flush latency for /metrics."""
+        return {
+            "pending_users": len(self.pending),
+            "pending_views": self.pending_views,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "flushed_views": self.flushed_views,
+            "flush_ms_p50": percentile_ms(self.flush_times, 0.5),
+            "flush_ms_p99": percentile_ms(self.flush_times, 0.99)
+        }
+
+
+def merge_increments(target: Increments, increments: Increments) -> Increments:
+    """Add increments into target (in place) and return it."""
+    for key, weight in increments.items():
+        target[key] = target.get(key, 0.0) + weight
+    return target
+
+
+view_buffer = ViewBuffer(
+    flush_size=settings.view_flush_size,
+    flush_interval=settings.view_flush_interval_seconds
+)
@@ -5,6 +5,7 @@ Utils package initialization.
 from app.utils.security import (
     hash_password,
     verify_password,
+    verify_and_update_password,
     create_access_token,
     decode_access_token,
     get_current_user,
@@ -12,18 +13,32 @@ from app.utils.security import (
 )
 from app.utils.helpers import (
     parse_genres,
+    split_list,
     is_adult_rating,
-    calculate_pages
+    calculate_pages,
+    tokenize,
+    encode_cursor,
+    decode_cursor,
+    percentile_ms
 )
+from app.utils.responses import json_dumps, FastJSONResponse
 
 __all__ = [
     "hash_password",
     "verify_password",
+    "verify_and_update_password",
     "create_access_token",
     "decode_access_token",
     "get_current_user",
     "get_current_user_optional",
     "parse_genres",
+    "split_list",
     "is_adult_rating",
-    "calculate_pages"
+    "calculate_pages",
+    "tokenize",
+    "encode_cursor",
+    "decode_cursor",
+    "percentile_ms",
+    "json_dumps",
+    "FastJSONResponse"
 ]
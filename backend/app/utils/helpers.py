@@ -2,7 +2,18 @@
 Helper utility functions.
 """
 
-from typing import List
+import base64
+import json
+import re
+import unicodedata
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+# Word characters only - punctuation and underscores separate tokens
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
 
 
 def parse_genres(listed_in: str) -> List[str]:
@@ -12,6 +23,13 @@ def parse_genres(listed_in: str) -> List[str]:
     return [genre.strip() for genre in listed_in.split(",")]
 
 
+def split_list(value: Optional[str]) -> List[str]:
+    """Split a comma-joined field (cast, director, country) into trimmed values."""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
 def is_adult_rating(rating: str) -> bool:
     """Check if a rating is for adults only (R-rated)."""
     adult_ratings = ["R", "NC-17", "TV-MA"]
@@ -21,3 +39,40 @@ def is_adult_rating(rating: str) -> bool:
 def calculate_pages(total: int, limit: int) -> int:
     """Calculate total number of pages."""
     return (total + limit - 1) // limit if limit > 0 else 0
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase, accent-free word tokens for searching."""
+    if not text:
+        return []
+    folded = unicodedata.normalize("NFKD", text.casefold())
+    folded = "".join(char for char in folded if not unicodedata.combining(char))
+    return _TOKEN_PATTERN.findall(folded)
+
+
+def encode_cursor(date_added: Optional[datetime], object_id: ObjectId) -> str:
+    """Encode a show's position in the list ordering as an opaque token."""
+    position = [date_added.isoformat() if date_added else None, str(object_id)]
+    token = base64.urlsafe_b64encode(json.dumps(position).encode("utf-8"))
+    return token.decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], ObjectId]:
+    """Decode a token from encode_cursor (raises ValueError if malformed)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date_added, object_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (
+            datetime.fromisoformat(date_added) if date_added else None,
+            ObjectId(object_id)
+        )
+    except (TypeError, ValueError, InvalidId) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def percentile_ms(seconds: Iterable[float], fraction: float) -> Optional[float]:
+    """Percentile (0-1) of durations in seconds, in milliseconds; None when empty."""
+    ordered = sorted(seconds)
+    if not ordered:
+        return None
+    return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000, 2)
@@ -0,0 +1,30 @@
+"""
+Fast JSON encoding for responses built from plain dicts.
+
+Uses orjson when it is installed and falls back to the standard library.
+Content is encoded as is - no response model validation on the way out.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(content: Any) -> bytes:
+    """Encode plain JSON-compatible data to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with json_dumps (orjson when available)."""
+    
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
@@ -3,18 +3,41 @@ Security utilities for password hashing and JWT operations.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+from typing import Optional, Tuple
+from jose import JWTError, jwt as jose_jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.config import get_settings
 from app.models.user import TokenData
+from app.utils.token_cache import TokenCache
 
 settings = get_settings()
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes made at any other cost are replaced on the next login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds
+)
+
+
+def _load_jwt_backend():
+    """The configured JWT library and the error it raises on bad tokens."""
+    if settings.jwt_backend == "pyjwt":
+        try:
+            import jwt as pyjwt
+            return pyjwt, pyjwt.PyJWTError
+        except ImportError:
+            print("⚠️  PyJWT is not installed - using python-jose for tokens")
+    return jose_jwt, JWTError
+
+
+jwt, InvalidTokenError = _load_jwt_backend()
+
+# Tokens already verified, until they expire
+token_cache = TokenCache(settings.token_cache_size)
 
 # HTTP Bearer security scheme
 security = HTTPBearer()
@@ -30,6 +53,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password; also returns a new hash if the stored one is outdated."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -47,6 +75,10 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 def decode_access_token(token: str) -> TokenData:
     """Decode and validate a JWT access token."""
+    token_data = token_cache.get(token)
+    if token_data is not None:
+        return token_data
+    
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         email: str = payload.get("sub")
@@ -60,9 +92,12 @@ def decode_access_token(token: str) -> TokenData:
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        return TokenData(email=email, user_id=user_id, age=age)
+        token_data = TokenData(email=email, user_id=user_id, age=age)
+        if payload.get("exp"):
+            token_cache.put(token, token_data, payload["exp"])
+        return token_data
     
-    except JWTError:
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
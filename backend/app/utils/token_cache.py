@@ -0,0 +1,64 @@
+"""
+Cache of verified access tokens.
+
+The frontend sends its bearer token with nearly every request, so the
+same token is verified over and over. Once a token has been verified its
+claims can't change, so the decoded TokenData is kept - keyed by the
+token's SHA-256 digest - until the token expires.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.models.user import TokenData
+
+
+class TokenCache:
+    """Bounded LRU of token digest -> (TokenData, expiry timestamp)."""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Tuple[TokenData, float]]" = OrderedDict()
+    
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+    
+    def get(self, token: str) -> Optional[TokenData]:
+        """Get a verified token's data, or None if it isn't cached or has expired."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            token_data, expires_at = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return token_data
+            del self._entries[key]
+        self.misses += 1
+        return None
+    
+    def put(self, token: str, token_data: TokenData, expires_at: float) -> None:
+        """Remember a verified token until its expiry."""
+        key = self._key(token)
+        self._entries[key] = (token_data, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+    
+    def metrics(self) -> dict:
+        """Hit and miss counts for /metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None
+        }
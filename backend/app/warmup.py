@@ -0,0 +1,101 @@
+"""
+Startup warm-up.
+
+Right after a deploy the first requests would pay for cold MongoDB
+connections, a cold working set and code paths nothing has run yet.
+Warm-up does that work once, in the background after startup, and
+/ready only reports ready when it is done. Each step is timed and
+logged; a failed step is logged and skipped.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+from fastapi import FastAPI
+
+from app.config import get_settings
+from app.database import get_database
+from app.services.catalog import catalog
+from app.services.genre_cache import genre_cache
+from app.services.similarity import similarity_index
+
+settings = get_settings()
+
+# What the home page asks for first - one page per type tab
+FIRST_PAGES = [
+    "/api/shows?page=1&limit=15&view=summary",
+    "/api/shows?page=1&limit=15&view=summary&type=Movie",
+    "/api/shows?page=1&limit=15&view=summary&type=TV%20Show",
+]
+
+
+class Warmup:
+    """Runs the warm-up steps and tracks whether the app is ready."""
+    
+    def __init__(self):
+        self.ready = False
+        # Step name -> milliseconds taken
+        self.steps: Dict[str, float] = {}
+        self.failed: List[str] = []
+    
+    async def _step(self, name: str, run: Callable[[], Awaitable[None]]) -> None:
+        """Run one step, timing and logging it."""
+        started = time.perf_counter()
+        try:
+            await run()
+        except Exception as e:
+            self.failed.append(name)
+            print(f"⚠️  Warm-up step {name} failed: {e}")
+        self.steps[name] = round((time.perf_counter() - started) * 1000, 1)
+        print(f"🔥 Warm-up {name}: {self.steps[name]:.0f} ms")
+    
+    async def _open_connections(self) -> None:
+        """Open the pooled MongoDB connections now, not on the first requests."""
+        db = get_database()
+        # Concurrent commands each check out their own connection
+        await asyncio.gather(*[
+            db.command("ping") for _ in range(settings.mongo_min_pool_size)
+        ])
+    
+    async def _load_catalog(self) -> None:
+        await catalog.load(get_database())
+    
+    async def _load_similarity_index(self) -> None:
+        if not await asyncio.to_thread(similarity_index.refresh):
+            print("⚠️  No similarity index - run scripts/build_similarity_index.py for similar titles")
+    
+    async def _load_genres(self) -> None:
+        await genre_cache.get(get_database().shows)
+    
+    async def _render_first_pages(self, app: FastAPI) -> None:
+        """Request the first list pages in-process - fills the response cache on the way."""
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://warmup") as client:
+            for url in FIRST_PAGES:
+                response = await client.get(url)
+                response.raise_for_status()
+    
+    async def run(self, app: FastAPI, started_at: float) -> None:
+        """Run every step, then mark the app ready (started_at: perf_counter at startup)."""
+        await self._step("mongo_connections", self._open_connections)
+        await self._step("catalog", self._load_catalog)
+        await self._step("similarity_index", self._load_similarity_index)
+        await self._step("genres", self._load_genres)
+        await self._step("first_pages", lambda: self._render_first_pages(app))
+        
+        self.ready = True
+        total = (time.perf_counter() - started_at) * 1000
+        print(f"✅ Ready {total:.0f} ms after startup" + (f" ({', '.join(self.failed)} failed)" if self.failed else ""))
+    
+    def status(self) -> dict:
+        """Readiness and step timings for /ready."""
+        return {
+            "status": "ready" if self.ready else "warming up",
+            "steps_ms": self.steps,
+            "failed": self.failed
+        }
+
+
+warmup = Warmup()
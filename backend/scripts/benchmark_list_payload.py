@@ -0,0 +1,86 @@
+"""
+Benchmark /api/shows payload size and serialization time per view.
+
+Builds real pages from MongoDB for the full view and the lean summary
+view, then times building the responses from the documents and encoding
+them to JSON bytes.
+
+Usage:
+    python scripts/benchmark_list_payload.py [--iterations 200]
+"""
+
+import argparse
+import asyncio
+import time
+from motor.motor_asyncio import AsyncIOMotorClient
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import get_settings
+from app.services.show_service import ShowService
+from app.utils.responses import json_dumps
+
+settings = get_settings()
+
+PAGE_SIZES = [15, 100]
+
+VIEWS = {
+    "full": None,
+    "summary": ShowService.SUMMARY_FIELDS,
+}
+
+
+async def benchmark(iterations: int):
+    """Measure bytes, build and serialization time for each view and page size."""
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    service = ShowService(client[settings.database_name])
+    # Posters are already on the documents or missing - never call OMDB here
+    service.imdb_service.api_key = ""
+    
+    print(f"📏 {iterations} iterations per page")
+    print(f"{'limit':>6}  {'view':<10}{'bytes':>10}{'build ms':>10}{'serialize ms':>14}")
+    
+    for limit in PAGE_SIZES:
+        for view, fields in VIEWS.items():
+            shows, total, _ = await service._query_shows(
+                0, limit, projection=service._list_projection(fields)
+            )
+            
+            build_time = serialize_time = 0.0
+            for _ in range(iterations):
+                started = time.perf_counter()
+                responses, _ = await service._build_show_responses(shows, fields)
+                built = time.perf_counter()
+                payload = json_dumps({
+                    "shows": responses,
+                    "total": total,
+                    "page": 1,
+                    "pages": 1,
+                    "has_next": False,
+                    "has_prev": False
+                })
+                build_time += built - started
+                serialize_time += time.perf_counter() - built
+            
+            print(
+                f"{limit:>6}  {view:<10}{len(payload):>10}"
+                f"{build_time * 1000 / iterations:>10.3f}"
+                f"{serialize_time * 1000 / iterations:>14.3f}"
+            )
+    
+    client.close()
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark /api/shows payloads.")
+    parser.add_argument("--iterations", type=int, default=200, help="serializations per page")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(benchmark(args.iterations))
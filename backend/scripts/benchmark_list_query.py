@@ -0,0 +1,140 @@
+"""
+Benchmark the MongoDB list query behind /api/shows.
+
+Compares the old two-query approach (count_documents, then find) with the
+single $facet aggregation and, for unfiltered listings, the estimated
+count. Reports round trips per request and p50/p99 latency.
+
+Usage:
+    python scripts/benchmark_list_query.py [--requests 200] [--limit 15]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import get_settings
+from app.services.catalog import catalog
+from app.services.facets import KIDS_RATINGS
+from app.services.show_service import ShowService
+
+settings = get_settings()
+
+# name -> _query_shows filters
+SCENARIOS = {
+    "unfiltered": {},
+    "type=Movie": {"show_type": "Movie"},
+    "search=love": {"search": "love"},
+    "genre=Dramas, page 20": {"genre": "Dramas", "page": 20},
+    "kids_mode": {"kids_mode": True},
+}
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts the commands (round trips) sent to MongoDB."""
+    
+    def __init__(self):
+        self.count = 0
+    
+    def started(self, event):
+        self.count += 1
+    
+    def succeeded(self, event):
+        pass
+    
+    def failed(self, event):
+        pass
+
+
+async def two_queries(service: ShowService, skip: int, limit: int, query: dict):
+    """The old list query: a count, then the page."""
+    total = await service.collection.count_documents(query)
+    cursor = service.collection.find(query).sort(catalog.SORT).skip(skip).limit(limit + 1)
+    shows = await cursor.to_list(length=limit + 1)
+    return shows[:limit], total, len(shows) > limit
+
+
+def build_query(filters: dict) -> dict:
+    """The filter the old list query used for a scenario."""
+    query = {}
+    if filters.get("show_type"):
+        query["type"] = filters["show_type"]
+    if filters.get("search"):
+        query["$or"] = [
+            {field: {"$regex": filters["search"], "$options": "i"}}
+            for field in ("title", "cast", "director")
+        ]
+    if filters.get("genre"):
+        query["genres"] = filters["genre"]
+    if filters.get("kids_mode"):
+        query["rating"] = {"$in": KIDS_RATINGS}
+    return query
+
+
+async def measure(run, requests: int, counter: CommandCounter):
+    """Run a query repeatedly; return (round trips per request, p50 ms, p99 ms)."""
+    await run()  # Warm up
+    counter.count = 0
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    p99 = statistics.quantiles(timings, n=100)[98] if len(timings) > 1 else timings[0]
+    return counter.count / requests, statistics.median(timings), p99
+
+
+async def benchmark(requests: int, limit: int):
+    """Time every variant of every scenario against the configured database."""
+    counter = CommandCounter()
+    client = AsyncIOMotorClient(settings.mongodb_url, event_listeners=[counter])
+    service = ShowService(client[settings.database_name])
+    
+    print(f"📏 {requests} requests per variant, limit={limit}")
+    print(f"{'scenario':<24}{'variant':<18}{'trips':>7}{'p50 ms':>10}{'p99 ms':>10}")
+    
+    for name, filters in SCENARIOS.items():
+        filters = dict(filters)
+        skip = (filters.pop("page", 1) - 1) * limit
+        query = build_query(filters)
+        
+        async def facet():
+            settings.estimated_count_unfiltered = False
+            return await service._query_shows(skip, limit, **filters)
+        
+        variants = {
+            "count + find": lambda: two_queries(service, skip, limit, query),
+            "$facet": facet,
+        }
+        if not query:
+            async def estimated():
+                settings.estimated_count_unfiltered = True
+                return await service._query_shows(skip, limit, **filters)
+            variants["estimated count"] = estimated
+        
+        for variant, run in variants.items():
+            trips, p50, p99 = await measure(run, requests, counter)
+            print(f"{name:<24}{variant:<18}{trips:>7.1f}{p50:>10.2f}{p99:>10.2f}")
+    
+    client.close()
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the /api/shows MongoDB query.")
+    parser.add_argument("--requests", type=int, default=200, help="requests per variant")
+    parser.add_argument("--limit", type=int, default=15, help="shows per page")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(benchmark(args.requests, args.limit))
@@ -0,0 +1,125 @@
+"""
+Load test /api/shows latency during a login storm.
+
+Measures list-endpoint latency on its own, then while many clients log in
+at once - first with password hashing on the bcrypt thread pool, then on
+the event loop as it used to be. With the pool, p99 should barely move.
+
+Runs in-process against the configured MongoDB; the benchmark user is
+removed afterwards.
+
+Usage:
+    python scripts/benchmark_login_storm.py [--seconds 5] [--readers 8] [--logins 16]
+"""
+
+import argparse
+import asyncio
+import time
+import httpx
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import get_settings
+from app.main import app
+from app.database import connect_to_database, close_database_connection, get_database
+from app.services.catalog import catalog
+from app.services.password_hasher import password_hasher
+from app.utils.helpers import percentile_ms
+
+settings = get_settings()
+
+PASSWORD = "StormTest123!"
+
+
+async def phase(client: httpx.AsyncClient, seconds: float, readers: int, logins: int, email: str) -> dict:
+    """Read list pages for a while, with logins running alongside."""
+    latencies = []
+    signed_in = rejected = 0
+    deadline = time.perf_counter() + seconds
+    
+    async def reader():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.get("/api/shows?limit=15")
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+    
+    async def login():
+        nonlocal signed_in, rejected
+        while time.perf_counter() < deadline:
+            response = await client.post("/api/auth/login", json={"email": email, "password": PASSWORD})
+            if response.status_code == 503:
+                rejected += 1
+                await asyncio.sleep(float(response.headers.get("Retry-After", "1")))
+            else:
+                response.raise_for_status()
+                signed_in += 1
+    
+    await asyncio.gather(*[reader() for _ in range(readers)], *[login() for _ in range(logins)])
+    return {
+        "p50": percentile_ms(latencies, 0.5),
+        "p99": percentile_ms(latencies, 0.99),
+        "logins": signed_in / seconds,
+        "rejected": rejected
+    }
+
+
+def report(name: str, result: dict):
+    """Print one phase's results."""
+    print(
+        f"   {name:<24} p50 {result['p50']:>7.2f} ms   p99 {result['p99']:>7.2f} ms   "
+        f"{result['logins']:>6.1f} logins/sec   {result['rejected']} turned away"
+    )
+
+
+async def benchmark(seconds: float, readers: int, logins: int):
+    """Compare list latency without logins, with pooled hashing and with inline hashing."""
+    await connect_to_database()
+    await catalog.load(get_database())
+    email = f"storm_{int(time.time())}@fletnix.com"
+    # The storm is deliberate - don't let the login rate limits cut it short
+    settings.login_rate_limit_per_ip = settings.login_rate_limit_per_email = 10 ** 9
+    
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        response = await client.post(
+            "/api/auth/register",
+            json={"email": email, "password": PASSWORD, "age": 25}
+        )
+        response.raise_for_status()
+        
+        try:
+            print(f"🌩️  {readers} list readers, {logins} concurrent logins, {seconds:g}s per phase")
+            report("no logins", await phase(client, seconds, readers, 0, email))
+            report(
+                f"bcrypt pool ({password_hasher.workers} threads)",
+                await phase(client, seconds, readers, logins, email)
+            )
+            
+            workers, password_hasher.workers = password_hasher.workers, 0
+            report("bcrypt on event loop", await phase(client, seconds, readers, logins, email))
+            password_hasher.workers = workers
+            
+            print(f"   pool: {password_hasher.metrics()}")
+        finally:
+            await get_database().users.delete_one({"email": email})
+    
+    password_hasher.shutdown()
+    await close_database_connection()
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Load test list latency during a login storm.")
+    parser.add_argument("--seconds", type=float, default=5.0, help="duration of each phase")
+    parser.add_argument("--readers", type=int, default=8, help="concurrent /api/shows clients")
+    parser.add_argument("--logins", type=int, default=16, help="concurrent login clients")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(benchmark(args.seconds, args.readers, args.logins))
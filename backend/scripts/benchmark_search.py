@@ -0,0 +1,98 @@
+"""
+Benchmark in-memory catalog search behind /api/shows?search=.
+
+Builds the catalog from the CSV (no database needed) and times
+Catalog.select for the searches a user types, including the one-letter
+prefixes of the first keystroke, which match most of the catalog. The
+first call of each search is timed separately from repeats, which reuse
+the index's per-token cache.
+
+Usage:
+    python scripts/benchmark_search.py [--repeats 50]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+import sys
+
+from bson import ObjectId
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.catalog import Catalog
+from scripts.import_data import iter_shows
+
+CSV_PATH = Path(__file__).parent.parent.parent / "data" / "netflix_titles.csv"
+
+# name -> Catalog.select filters
+SCENARIOS = {
+    "a": {"search": "a"},
+    "a, ranked": {"search": "a", "ranked": True},
+    "s": {"search": "s"},
+    "s, ranked": {"search": "s", "ranked": True},
+    "the": {"search": "the"},
+    "the, ranked": {"search": "the", "ranked": True},
+    "love": {"search": "love"},
+    "s, Movie, kids": {"search": "s", "show_type": "Movie", "kids_mode": True},
+    "the s, ranked, page 20": {"search": "the s", "ranked": True, "skip": 285},
+}
+
+
+async def load_catalog() -> Catalog:
+    """Build a catalog snapshot from the CSV, ordered like the collection."""
+    docs = [
+        {"_id": ObjectId(), **{field: show.get(field) for field in Catalog.PROJECTION}}
+        for show in iter_shows(CSV_PATH)
+    ]
+    docs.sort(
+        key=lambda doc: (
+            doc["date_added_parsed"] is not None,
+            doc["date_added_parsed"] or datetime.min,
+            doc["_id"]
+        ),
+        reverse=True
+    )
+    catalog = Catalog()
+    await catalog._rebuild(docs, (0, len(docs), "csv"))
+    return catalog
+
+
+async def benchmark(repeats: int):
+    """Time every scenario: first call, then the p50/p99 of repeats."""
+    catalog = await load_catalog()
+    
+    print(f"🔎 {repeats} repeats per search, limit=15")
+    print(f"{'search':<26}{'hits':>7}{'first ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    
+    for name, filters in SCENARIOS.items():
+        filters = dict(filters)
+        skip = filters.pop("skip", 0)
+        
+        started = time.perf_counter()
+        page = catalog.select(skip, 15, **filters)
+        first = (time.perf_counter() - started) * 1000
+        
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            catalog.select(skip, 15, **filters)
+            timings.append((time.perf_counter() - started) * 1000)
+        p99 = statistics.quantiles(timings, n=100)[98] if len(timings) > 1 else timings[0]
+        print(f"{name:<26}{page.total:>7}{first:>10.2f}{statistics.median(timings):>10.2f}{p99:>10.2f}")
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark in-memory catalog search.")
+    parser.add_argument("--repeats", type=int, default=50, help="timed repeats per search")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(benchmark(args.repeats))
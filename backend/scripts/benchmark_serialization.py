@@ -0,0 +1,95 @@
+"""
+Micro-benchmark list response serialization at limit=100.
+
+Compares encoding a page the old way (validating it into the response
+models, then dumping them) with the fast path (plain dicts straight to
+JSON bytes), then measures end-to-end requests/sec of /api/shows
+in-process with the response cache bypassed.
+
+Usage:
+    python scripts/benchmark_serialization.py [--seconds 5] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import time
+import httpx
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.main import app
+from app.database import connect_to_database, close_database_connection, get_database
+from app.models.show import ShowListResponse
+from app.services.catalog import catalog
+from app.services.response_cache import response_cache
+from app.services.show_service import ShowService
+from app.utils import responses
+from app.utils.responses import json_dumps
+
+LIMIT = 100
+
+
+def rate(run, seconds: float) -> float:
+    """Call run repeatedly for about the given time; return calls per second."""
+    calls = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        run()
+        calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+async def requests_per_second(seconds: float, concurrency: int) -> float:
+    """Hammer /api/shows?limit=100 in-process from several clients."""
+    transport = httpx.ASGITransport(app=app)
+    done = 0
+    deadline = time.perf_counter() + seconds
+    
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        async def worker():
+            nonlocal done
+            while time.perf_counter() < deadline:
+                response = await client.get(f"/api/shows?limit={LIMIT}")
+                response.raise_for_status()
+                done += 1
+        
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return done / (time.perf_counter() - started)
+
+
+async def benchmark(seconds: float, concurrency: int):
+    """Compare the encoders, then measure the endpoint."""
+    await connect_to_database()
+    await catalog.load(get_database())
+    service = ShowService(get_database())
+    # Posters are already on the documents or missing - never call OMDB here
+    service.imdb_service.api_key = ""
+    page = await service.get_shows(limit=LIMIT)
+    
+    encoder = "orjson" if responses.orjson is not None else "json"
+    print(f"📏 limit={LIMIT}, {len(json_dumps(page))} bytes per page")
+    print(f"   response models: {rate(lambda: ShowListResponse(**page).model_dump_json(), seconds):>9.0f} pages/sec")
+    print(f"   fast path ({encoder}): {rate(lambda: json_dumps(page), seconds):>9.0f} pages/sec")
+    
+    # Every request renders its page instead of hitting the response cache
+    response_cache.ttl = response_cache.stale = 0
+    print(f"   /api/shows end to end: {await requests_per_second(seconds, concurrency):>9.0f} requests/sec")
+    
+    await close_database_connection()
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization.")
+    parser.add_argument("--seconds", type=float, default=5.0, help="time per measurement")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent clients (end to end)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(benchmark(args.seconds, args.concurrency))
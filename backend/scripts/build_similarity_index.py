@@ -0,0 +1,157 @@
+"""
+Build the content-similarity index behind /api/shows/{show_id}/similar.
+
+Every show becomes a vector of hashed TF-IDF features over its genres,
+cast, directors, countries and description words. Vectors are
+L2-normalized, so a dot product between two of them is their cosine
+similarity, and saved feature-major (one row per feature column, one
+column per show) as .npy files the API memory-maps.
+
+Features only one show has are left out - they can't match another show
+and would only collide with ones that can. 4096 columns keep the ~22k
+remaining features apart well enough. A lookup only reads the columns
+the show uses (about two dozen), so it takes well under a millisecond
+whatever the column count; more columns just cost memory.
+
+Run after importing the data:
+    python scripts/build_similarity_index.py [--dimensions 4096] [--output DIR]
+
+The API picks up a rebuilt index on the next request.
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import time
+import zlib
+from collections import Counter
+from motor.motor_asyncio import AsyncIOMotorClient
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import get_settings
+from app.utils.helpers import tokenize
+
+settings = get_settings()
+
+# How much matching on each field counts towards similarity
+FIELD_WEIGHTS = {
+    "genres": 1.0,
+    "directors": 1.0,
+    "cast_list": 0.6,
+    "countries": 0.3,
+    "description": 0.4,
+}
+
+# Description words too common to say anything about a show
+STOP_WORDS = set(
+    "a an and are as at be but by for from has he her his in into is it its "
+    "of on or she that the their them they this to when who whose with".split()
+)
+
+
+def features(show: dict) -> Counter:
+    """Count the features of a show, each prefixed with its field."""
+    counts = Counter()
+    for field in ("genres", "directors", "cast_list", "countries"):
+        for value in show.get(field) or []:
+            counts[f"{field}:{value.casefold()}"] += 1
+    for word in tokenize(show.get("description")):
+        if word not in STOP_WORDS and len(word) > 2:
+            counts[f"description:{word}"] += 1
+    return counts
+
+
+def feature_slot(feature: str, dimensions: int):
+    """Hash a feature to a column and a sign (stable across processes)."""
+    hashed = zlib.crc32(feature.encode("utf-8"))
+    return hashed % dimensions, 1.0 if hashed & 0x80000000 else -1.0
+
+
+def build_matrix(shows: list, dimensions: int) -> np.ndarray:
+    """Hashed TF-IDF rows, L2-normalized."""
+    show_features = [features(show) for show in shows]
+    document_frequency = Counter()
+    for counts in show_features:
+        document_frequency.update(counts.keys())
+    
+    total = len(shows)
+    matrix = np.zeros((total, dimensions), dtype=np.float32)
+    for row, counts in enumerate(show_features):
+        for feature, count in counts.items():
+            # Features only this show has can't match anything, and
+            # features every show has carry no signal
+            if document_frequency[feature] == 1:
+                continue
+            idf = math.log(total / document_frequency[feature])
+            if idf <= 0:
+                continue
+            field = feature.split(":", 1)[0]
+            column, sign = feature_slot(feature, dimensions)
+            matrix[row, column] += sign * FIELD_WEIGHTS[field] * (1 + math.log(count)) * idf
+    
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def save(directory: Path, name: str, array: np.ndarray) -> None:
+    """Write an array next to its final name, then swap it in."""
+    temporary = directory / f"{name}.tmp.npy"
+    np.save(temporary, array)
+    os.replace(temporary, directory / f"{name}.npy")
+
+
+async def build_index(dimensions: int, output: Path):
+    """Read every show from MongoDB and write the similarity index."""
+    print(f"🔌 Connecting to MongoDB: {settings.mongodb_url}")
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    collection = client[settings.database_name].shows
+    
+    started = time.perf_counter()
+    shows = await collection.find(
+        {},
+        {"rating": 1, "genres": 1, "directors": 1, "cast_list": 1, "countries": 1, "description": 1}
+    ).to_list(length=None)
+    client.close()
+    
+    if not shows:
+        print("❌ No shows found - import the data first")
+        return
+    
+    matrix = build_matrix(shows, dimensions)
+    
+    output.mkdir(parents=True, exist_ok=True)
+    # IDs and ratings first - the API reloads when the features change and
+    # checks that all three files line up
+    save(output, "ids", np.array([str(show["_id"]) for show in shows], dtype="U24"))
+    save(output, "ratings", np.array([show.get("rating") or "" for show in shows], dtype="U16"))
+    save(output, "features", np.ascontiguousarray(matrix.T))
+    
+    elapsed = time.perf_counter() - started
+    print(f"✅ Indexed {len(shows)} shows x {dimensions} features in {elapsed:.1f}s ({matrix.nbytes / 1e6:.1f} MB)")
+    print(f"📁 Saved to {output.resolve()}")
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Build the FletNix similar-titles index.")
+    parser.add_argument("--dimensions", type=int, default=4096, help="hashed feature columns")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(settings.similarity_index_dir),
+        help="directory for the index files"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(build_index(args.dimensions, args.output))
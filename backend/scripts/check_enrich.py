@@ -0,0 +1,135 @@
+"""
+Exercise the OMDB enrich mode of import_data.py against a local stub server.
+
+Starts a stand-in OMDB server, seeds a scratch database with shows it
+finds, doesn't know or fails for, and runs the enrich mode against both.
+A validator on the scratch collection rejects the writes for some shows,
+so the run has to survive failed bulk writes too. Then reports whether
+found and unknown shows are marked, and failed and unsaved ones are left
+for the next run.
+
+This is a manual script, not part of the test suite. It needs a real
+MongoDB server - mocks don't enforce the collection validator, so a run
+against one proves nothing about failed writes. The scratch database is
+dropped after.
+
+Usage:
+    python scripts/check_enrich.py [--shows 60] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+from urllib.parse import parse_qs, urlparse
+
+# A scratch database and a key the stub accepts, set before the settings load
+os.environ["DATABASE_NAME"] = "fletnix_enrich_check"
+os.environ["OMDB_API_KEY"] = "stub"
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.config import get_settings
+from scripts.import_data import enrich_data
+
+settings = get_settings()
+
+# Title prefix -> what should happen to the show
+KINDS = ("Found", "Unknown", "Broken", "Unsaved")
+
+
+class StubOMDBHandler(BaseHTTPRequestHandler):
+    """Answers OMDB title lookups based on the title's prefix."""
+    
+    def do_GET(self):
+        title = parse_qs(urlparse(self.path).query).get("t", [""])[0]
+        if title.startswith("Unknown"):
+            body = {"Response": "False", "Error": "Movie not found!"}
+        elif title.startswith("Broken"):
+            body = {"Response": "False", "Error": "Request limit reached!"}
+        else:
+            body = {
+                "Response": "True",
+                "Title": title,
+                "imdbRating": "7.5",
+                "Poster": f"https://posters.example/{title}.jpg",
+                "Ratings": []
+            }
+        
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+async def check(shows: int, workers: int) -> bool:
+    """Run the enrich mode on a seeded scratch database and check the result."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOMDBHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    omdb_url = f"http://127.0.0.1:{server.server_port}/"
+    
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    db = client[settings.database_name]
+    await db.drop_collection("shows")
+    # Marking an Unsaved show fails, the way a write does while MongoDB is down
+    await db.create_collection("shows", validator={"$or": [
+        {"omdb_fetched": {"$exists": False}},
+        {"title": {"$not": {"$regex": "^Unsaved"}}}
+    ]})
+    await db.shows.insert_many([
+        {"title": f"{KINDS[i % len(KINDS)]} {i}", "release_year": 2000 + i % 20}
+        for i in range(shows)
+    ])
+    
+    try:
+        # Every write of Unsaved shows fails - the run must still finish
+        await asyncio.wait_for(enrich_data(workers, batch_size=1, omdb_url=omdb_url), timeout=60)
+        
+        ok = True
+        for kind in KINDS:
+            query = {"title": {"$regex": f"^{kind} "}}
+            total = await db.shows.count_documents(query)
+            marked = await db.shows.count_documents({**query, "omdb_fetched": True})
+            expected = total if kind in ("Found", "Unknown") else 0
+            passed = marked == expected
+            ok &= passed
+            print(f"   {'✅' if passed else '❌'} {kind:<8} {marked}/{total} marked (expected {expected})")
+        
+        posters = await db.shows.count_documents({"omdb_poster": {"$ne": None}, "omdb_fetched": True})
+        found = await db.shows.count_documents({"title": {"$regex": "^Found "}})
+        ok &= posters == found
+        print(f"   {'✅' if posters == found else '❌'} {posters}/{found} found shows have a poster")
+        return ok
+    except asyncio.TimeoutError:
+        print("❌ The enrich run hung")
+        return False
+    finally:
+        await client.drop_database(settings.database_name)
+        client.close()
+        server.shutdown()
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Exercise the OMDB enrich mode against a stub server and MongoDB.")
+    parser.add_argument("--shows", type=int, default=60, help="shows to seed")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent OMDB requests")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if not asyncio.run(check(args.shows, args.workers)):
+        sys.exit(1)
@@ -2,12 +2,24 @@
 Script to import Netflix CSV data into MongoDB.
 
 Usage:
-    python scripts/import_data.py
+    python scripts/import_data.py [--batch-size 500] [--in-flight 4] [--limit N]
+    python scripts/import_data.py enrich [--workers 8] [--batch-size 500] [--omdb-url URL]
+    python scripts/import_data.py rollback
+    python scripts/import_data.py migrate
+
+The enrich mode fetches posters and ratings from OMDB for every show that
+hasn't been fetched yet, so the list endpoints never call OMDB themselves.
+scripts/check_enrich.py exercises it against a stub OMDB server (run it by
+hand - it needs a real MongoDB).
 """
 
+import argparse
 import csv
 import asyncio
+import time
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 from pathlib import Path
 import sys
 from datetime import datetime
@@ -16,58 +28,41 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import get_settings
+from app.http_client import get_http_client, close_http_client
+from app.services.imdb_service import IMDBService
+from app.database import backfill_normalized_fields, normalized_fields
 
 settings = get_settings()
 
+# Imports are built here and renamed over shows once complete
+STAGING_COLLECTION = "shows_staging"
 
-async def import_data():
-    """Import Netflix CSV data into MongoDB."""
-    
-    # Connect to MongoDB
-    client = AsyncIOMotorClient(settings.mongodb_url)
-    db = client[settings.database_name]
-    collection = db.shows
-    
-    # Path to CSV file
-    csv_path = Path(__file__).parent.parent.parent / "data" / "netflix_titles.csv"
-    
-    if not csv_path.exists():
-        print(f"❌ CSV file not found at: {csv_path}")
-        return
-    
-    print(f"📂 Reading CSV from: {csv_path}")
-    
-    # Clear existing data
-    await collection.delete_many({})
-    print("🗑️  Cleared existing data")
-    
-    # Read and insert data (only first 4000 records to save disk space)
-    shows = []
-    max_records = 4000  # Limit records to save disk space on free tier
-    
+# The catalog replaced by the last import, kept for rollback
+PREVIOUS_COLLECTION = "shows_previous"
+
+
+def parse_date_added(date_added: str):
+    """Parse a date like "September 25, 2021" (None if missing or malformed)."""
+    date_added = (date_added or "").strip()
+    if not date_added:
+        return None
+    try:
+        return datetime.strptime(date_added, "%B %d, %Y")
+    except ValueError:
+        return None
+
+
+def iter_shows(csv_path: Path, max_records: int = None):
+    """Stream cleaned show documents from the CSV, one row at a time."""
     with open(csv_path, 'r', encoding='utf-8') as file:
         reader = csv.DictReader(file)
         
         for i, row in enumerate(reader):
-            if i >= max_records:
+            if max_records is not None and i >= max_records:
                 break
-                
-            # Parse date_added string to datetime
-            date_added_str = row.get("date_added", "").strip()
-            date_added_parsed = None
-            if date_added_str:
-                try:
-                    # Format: "September 25, 2021"
-                    date_added_parsed = datetime.strptime(date_added_str, "%B %d, %Y")
-                except ValueError:
-                    try:
-                        # Try alternate format without leading zero: "September 5, 2021"
-                        date_added_parsed = datetime.strptime(date_added_str, "%B %d, %Y")
-                    except ValueError:
-                        date_added_parsed = None
             
             # Clean and transform data
-            show = {
+            yield {
                 "show_id": row.get("show_id", ""),
                 "type": row.get("type", ""),
                 "title": row.get("title", ""),
@@ -75,21 +70,31 @@ async def import_data():
                 "cast": row.get("cast") or None,
                 "country": row.get("country") or None,
                 "date_added": row.get("date_added") or None,
-                "date_added_parsed": date_added_parsed,  # Proper datetime for sorting
+                "date_added_parsed": parse_date_added(row.get("date_added")),  # Proper datetime for sorting
                 "release_year": int(row.get("release_year")) if row.get("release_year") else None,
                 "rating": row.get("rating") or None,
                 "duration": row.get("duration") or None,
                 "listed_in": row.get("listed_in") or None,
                 "description": row.get("description") or None,
+                # Normalized copies of the comma-joined fields for indexed lookups
+                **normalized_fields(row),
             }
-            shows.append(show)
-    
-    # Batch insert
-    if shows:
-        result = await collection.insert_many(shows)
-        print(f"✅ Inserted {len(result.inserted_ids)} shows")
-    
-    # Create indexes (with error handling for disk space issues)
+
+
+def iter_batches(items, size: int):
+    """Group an iterable into lists of at most size items."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def create_indexes(collection):
+    """Create the shows indexes (with error handling for disk space issues)."""
     try:
         await collection.create_index([
             ("title", "text"),
@@ -100,16 +105,302 @@ async def import_data():
         await collection.create_index("type")
         await collection.create_index("rating")
         await collection.create_index("listed_in")
+        await collection.create_index("genres")  # Multikey indexes on the normalized arrays
+        await collection.create_index("cast_list")
+        await collection.create_index("directors")
+        await collection.create_index("countries")
         await collection.create_index("show_id")
-        await collection.create_index([("date_added_parsed", -1)])  # Index for date sorting
+        await collection.create_index([("updated_at", -1)])  # Newest edit, for catalog refreshes
+        await collection.create_index([("date_added_parsed", -1), ("_id", -1)])  # Index for date sorting and cursors
         print("📑 Created indexes")
     except Exception as e:
         print(f"⚠️  Could not create indexes (may be disk space issue): {e}")
+
+
+async def bump_generation(db, count: int):
+    """Record a new catalog generation so running API workers rebuild their caches."""
+    meta = await db.catalog_meta.find_one_and_update(
+        {"_id": "shows"},
+        {
+            "$inc": {"generation": 1},
+            "$set": {"count": count, "swapped_at": datetime.utcnow()}
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    print(f"🔁 Catalog generation is now {meta['generation']}")
+
+
+async def import_data(batch_size: int, in_flight: int, max_records: int = None):
+    """
+    Import Netflix CSV data into MongoDB without downtime.
+    
+    The import is loaded into a staging collection (seeded from the live
+    one, so IDs and OMDB data are kept), indexed and validated there, then
+    atomically renamed over shows. The replaced collection is kept as
+    shows_previous for rollback.
+    """
+    
+    # Connect to MongoDB
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    db = client[settings.database_name]
+    
+    # Path to CSV file
+    csv_path = Path(__file__).parent.parent.parent / "data" / "netflix_titles.csv"
+    
+    if not csv_path.exists():
+        print(f"❌ CSV file not found at: {csv_path}")
+        return
+    
+    print(f"📂 Reading CSV from: {csv_path}")
+    
+    # Start the staging collection as a copy of the live catalog
+    await db.drop_collection(STAGING_COLLECTION)
+    if await db.shows.estimated_document_count():
+        await db.shows.aggregate([{"$match": {}}, {"$out": STAGING_COLLECTION}]).to_list(length=None)
+    collection = db[STAGING_COLLECTION]
+    
+    # Build every index before loading - the show_id index makes every
+    # upsert an index lookup
+    await create_indexes(collection)
+    
+    # Every row written by this run is stamped, so rows that have left the
+    # CSV can be removed afterwards
+    imported_at = datetime.utcnow()
+    limiter = asyncio.Semaphore(in_flight)
+    stats = {"rows": 0, "upserted": 0, "modified": 0}
+    show_ids = set()
+    started = time.perf_counter()
+    
+    async def write_batch(batch):
+        try:
+            result = await collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"show_id": show["show_id"]},
+                        {"$set": {**show, "imported_at": imported_at}},
+                        upsert=True
+                    )
+                    for show in batch
+                ],
+                ordered=False
+            )
+            stats["rows"] += len(batch)
+            stats["upserted"] += result.upserted_count
+            stats["modified"] += result.modified_count
+            show_ids.update(show["show_id"] for show in batch)
+            elapsed = time.perf_counter() - started
+            print(f"   {stats['rows']} rows - {stats['rows'] / elapsed:.0f} rows/sec")
+        finally:
+            limiter.release()
+    
+    # Only in_flight batches are read ahead of the database at any time
+    tasks = []
+    for batch in iter_batches(iter_shows(csv_path, max_records), batch_size):
+        await limiter.acquire()
+        tasks.append(asyncio.create_task(write_batch(batch)))
+    await asyncio.gather(*tasks)
+    
+    # Remove shows that are no longer in the CSV
+    removed = await collection.delete_many({"imported_at": {"$ne": imported_at}})
+    
+    elapsed = time.perf_counter() - started
+    print(
+        f"✅ Loaded {stats['rows']} rows in {elapsed:.1f}s "
+        f"({stats['rows'] / elapsed if elapsed else 0:.0f} rows/sec): "
+        f"{stats['upserted']} new, {stats['modified']} updated, "
+        f"{removed.deleted_count} removed"
+    )
+    
+    # Only swap in a complete catalog
+    count = await collection.count_documents({})
+    if count == 0 or count != len(show_ids):
+        print(
+            f"❌ Staging has {count} shows but the CSV has {len(show_ids)} - "
+            f"leaving the live catalog untouched"
+        )
+        client.close()
+        return
+    
+    # Keep the current generation for rollback (indexed again on rollback),
+    # then swap atomically
+    if await db.shows.estimated_document_count():
+        await db.shows.aggregate([{"$match": {}}, {"$out": PREVIOUS_COLLECTION}]).to_list(length=None)
+    await collection.rename("shows", dropTarget=True)
+    print(f"🔀 Swapped {count} shows into the live catalog")
+    
+    await bump_generation(db, count)
     
     # Close connection
     client.close()
     print("✅ Data import completed successfully!")
 
 
+async def rollback_data():
+    """Swap the previous catalog generation back in (the current one becomes previous)."""
+    
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    db = client[settings.database_name]
+    
+    count = await db[PREVIOUS_COLLECTION].count_documents({})
+    if count == 0:
+        print("❌ There is no previous catalog to roll back to")
+        client.close()
+        return
+    
+    # Set the current catalog aside, swap the previous one in atomically,
+    # then keep the set-aside copy as the new previous generation
+    await db.drop_collection(STAGING_COLLECTION)
+    await db.shows.aggregate([{"$match": {}}, {"$out": STAGING_COLLECTION}]).to_list(length=None)
+    await create_indexes(db[PREVIOUS_COLLECTION])
+    await db[PREVIOUS_COLLECTION].rename("shows", dropTarget=True)
+    await db[STAGING_COLLECTION].rename(PREVIOUS_COLLECTION, dropTarget=True)
+    print(f"⏪ Rolled back to the previous catalog ({count} shows)")
+    
+    await bump_generation(db, count)
+    client.close()
+
+
+async def enrich_data(workers: int, batch_size: int, omdb_url: str = None):
+    """Fetch OMDB posters and ratings for every show that doesn't have them yet."""
+    
+    imdb_service = IMDBService()
+    if not imdb_service.api_key:
+        print("❌ OMDB_API_KEY is not set")
+        return
+    if omdb_url:
+        imdb_service.base_url = omdb_url
+    
+    # The worker pool is the concurrency limit for this run
+    http = get_http_client()
+    http.omdb_limiter = asyncio.Semaphore(workers)
+    
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    collection = client[settings.database_name].shows
+    
+    # Shows are marked omdb_fetched as each batch is written, so that marker
+    # is the checkpoint - a rerun picks up whatever is still missing
+    query = {"omdb_fetched": {"$exists": False}}
+    remaining = await collection.count_documents(query)
+    print(f"🎞️  Enriching {remaining} shows with {workers} workers")
+    
+    queue = asyncio.Queue(maxsize=workers * 2)
+    updates = []
+    stats = {"done": 0, "found": 0, "failed": 0, "written": 0, "unsaved": 0}
+    started = time.perf_counter()
+    
+    async def flush():
+        """Write the pending updates in one unordered bulk write."""
+        batch = updates[:]
+        updates.clear()
+        if batch:
+            try:
+                result = await collection.bulk_write(batch, ordered=False)
+            except Exception as e:
+                # Rows that didn't get omdb_fetched are retried by the next
+                # run - keep the workers consuming so the producer can't block
+                written = e.details.get("nMatched", 0) if isinstance(e, BulkWriteError) else 0
+                stats["written"] += written
+                stats["unsaved"] += len(batch) - written
+                print(f"⚠️  Could not save {len(batch) - written} shows: {e}")
+                return
+            stats["written"] += result.matched_count
+            elapsed = time.perf_counter() - started
+            print(
+                f"   {stats['done']}/{remaining} shows "
+                f"({stats['found']} found, {stats['failed']} failed) - "
+                f"{stats['done'] / elapsed:.1f} shows/sec"
+            )
+    
+    async def worker():
+        while True:
+            show = await queue.get()
+            if show is None:
+                return
+            try:
+                result = await imdb_service.fetch_from_omdb(
+                    title=show.get("title", ""),
+                    year=show.get("release_year")
+                )
+            except Exception as e:
+                # Left unmarked so the next run retries it
+                print(f"⚠️  {show.get('title')}: {e}")
+                stats["failed"] += 1
+                stats["done"] += 1
+                continue
+            
+            updates.append(UpdateOne(
+                {"_id": show["_id"]},
+                {"$set": {
+                    "omdb_poster": result.poster if result else None,
+                    "omdb_rating": result.imdb_rating if result else None,
+                    "omdb_fetched": True
+                }}
+            ))
+            stats["found"] += 1 if result else 0
+            stats["done"] += 1
+            if len(updates) >= batch_size:
+                await flush()
+    
+    tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+    
+    async for show in collection.find(query, {"title": 1, "release_year": 1}).sort("_id", 1):
+        await queue.put(show)
+    for _ in tasks:
+        await queue.put(None)
+    
+    await asyncio.gather(*tasks)
+    await flush()
+    
+    elapsed = time.perf_counter() - started
+    print(
+        f"✅ Enriched {stats['written']} shows in {elapsed:.1f}s "
+        f"({stats['written'] / elapsed if elapsed else 0:.1f} shows/sec, "
+        f"{stats['failed']} failed, {stats['unsaved']} not saved)"
+    )
+    
+    await close_http_client()
+    client.close()
+
+
+async def migrate_data(batch_size: int):
+    """Backfill the normalized arrays on shows imported before they existed."""
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    collection = client[settings.database_name].shows
+    
+    updated = await backfill_normalized_fields(collection, batch_size)
+    print(f"✅ Migrated {updated} shows")
+    client.close()
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Import and enrich FletNix show data.")
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        default="import",
+        choices=["import", "enrich", "rollback", "migrate"],
+        help=(
+            "import the CSV (default), enrich shows with OMDB data, roll back the last import "
+            "or backfill normalized fields on an existing catalog"
+        )
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="writes per bulk write")
+    parser.add_argument("--in-flight", type=int, default=4, help="concurrent bulk writes (import)")
+    parser.add_argument("--limit", type=int, help="import only the first N rows (import)")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent OMDB requests (enrich)")
+    parser.add_argument("--omdb-url", help="OMDB base URL, e.g. a local stand-in server (enrich)")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    asyncio.run(import_data())
+    args = parse_args()
+    if args.mode == "enrich":
+        asyncio.run(enrich_data(args.workers, args.batch_size, args.omdb_url))
+    elif args.mode == "rollback":
+        asyncio.run(rollback_data())
+    elif args.mode == "migrate":
+        asyncio.run(migrate_data(args.batch_size))
+    else:
+        asyncio.run(import_data(args.batch_size, args.in_flight, args.limit))
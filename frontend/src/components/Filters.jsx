@@ -6,6 +6,8 @@ const Filters = ({
   selectedGenre, 
   setSelectedGenre, 
   genres,
+  typeCounts,
+  genreCounts,
   kidsMode,
   setKidsMode,
   onClearFilters 
@@ -14,6 +16,15 @@ const Filters = ({
 
   const hasFilters = selectedType !== 'All' || selectedGenre || kidsMode;
 
+  // "All" has no count of its own - it's the sum of every type
+  const typeCount = (type) => {
+    if (!typeCounts) return null;
+    if (type === 'All') {
+      return Object.values(typeCounts).reduce((sum, count) => sum + count, 0);
+    }
+    return typeCounts[type] ?? 0;
+  };
+
   return (
     <div className="bg-netflix-dark/50 backdrop-blur-sm rounded-lg p-4 mb-6">
       <div className="flex flex-wrap items-center gap-4">
@@ -38,6 +49,11 @@ const Filters = ({
                 }`}
               >
                 {type}
+                {typeCounts && (
+                  <span aria-hidden="true" className="ml-1 text-xs opacity-70">
+                    {typeCount(type)}
+                  </span>
+                )}
               </button>
             ))}
           </div>
@@ -55,6 +71,7 @@ const Filters = ({
             {genres.map((genre) => (
               <option key={genre} value={genre}>
                 {genre}
+                {genreCounts && ` (${genreCounts[genre] ?? 0})`}
               </option>
             ))}
           </select>
@@ -10,6 +10,10 @@ import Recommendations from '../components/Recommendations';
 import { showService } from '../services/showService';
 import { useAuth } from '../context/AuthContext';
 
+// How often, and how many times, to re-fetch a page whose posters are still loading
+const POSTER_POLL_MS = 2000;
+const POSTER_POLL_ATTEMPTS = 5;
+
 const Home = () => {
   const [searchParams, setSearchParams] = useSearchParams();
   const { isAuthenticated } = useAuth();
@@ -20,6 +24,7 @@ const Home = () => {
   const [total, setTotal] = useState(0);
   
   const [genres, setGenres] = useState([]);
+  const [facets, setFacets] = useState(null);
   
   const [recommendations, setRecommendations] = useState([]);
   const [recGenres, setRecGenres] = useState([]);
@@ -59,20 +64,16 @@ const Home = () => {
     updateParams({ kids: enabled ? 'true' : '', page: '1' });
   };
 
-  // Fetch genres on mount (only if authenticated)
-  useEffect(() => {
-    if (!isAuthenticated) return;
-    
-    const fetchGenres = async () => {
-      try {
-        const genreList = await showService.getGenres();
-        setGenres(genreList);
-      } catch (error) {
-        console.error('Error fetching genres:', error);
-      }
-    };
-    fetchGenres();
-  }, [isAuthenticated]);
+  // Fetch genres separately only when the list response has no facet counts
+  const fetchGenres = async () => {
+    try {
+      const genreList = await showService.getGenres();
+      // Keep a list already filled in from facets meanwhile
+      setGenres((prev) => (prev.length ? prev : genreList));
+    } catch (error) {
+      console.error('Error fetching genres:', error);
+    }
+  };
 
   // Fetch shows (only if authenticated)
   useEffect(() => {
@@ -81,12 +82,33 @@ const Home = () => {
       return;
     }
     
+    let cancelled = false;
+    let pollTimer;
+
+    // Posters still loading in the background - fetch the page again quietly
+    const pollPosters = (params, attempt) => {
+      pollTimer = setTimeout(async () => {
+        try {
+          const data = await showService.getShows(params);
+          if (cancelled) return;
+          setShows(data.shows);
+          if (data.posters_pending && attempt < POSTER_POLL_ATTEMPTS) {
+            pollPosters(params, attempt + 1);
+          }
+        } catch (error) {
+          console.error('Error refreshing posters:', error);
+        }
+      }, POSTER_POLL_MS);
+    };
+
     const fetchShows = async () => {
       setLoading(true);
       try {
         const params = {
           page: currentPage,
           limit: 15,
+          // Only what the show cards render
+          view: 'summary',
         };
 
         if (selectedType !== 'All') {
@@ -106,9 +128,24 @@ const Home = () => {
         }
 
         const data = await showService.getShows(params);
+        if (cancelled) return;
         setShows(data.shows);
         setTotalPages(data.pages);
         setTotal(data.total);
+
+        if (data.posters_pending) {
+          pollPosters(params, 1);
+        }
+
+        // Facet counts come with the list - no extra genre request needed
+        if (data.facets) {
+          setFacets(data.facets);
+          setGenres(Object.keys(data.facets.genres));
+        } else {
+          // Reads the current list in fetchGenres - genres here would be
+          // the value from when this effect last ran
+          fetchGenres();
+        }
       } catch (error) {
         console.error('Error fetching shows:', error);
         toast.error('Failed to fetch shows');
@@ -118,6 +155,11 @@ const Home = () => {
     };
 
     fetchShows();
+
+    return () => {
+      cancelled = true;
+      clearTimeout(pollTimer);
+    };
   }, [currentPage, selectedType, selectedGenre, searchQuery, kidsMode, isAuthenticated]);
 
   // Fetch recommendations for authenticated users
@@ -201,7 +243,7 @@ const Home = () => {
                 <div className="flex flex-wrap justify-center gap-8 text-gray-400">
                   <div className="flex items-center gap-2">
                     <FiFilm className="w-5 h-5 text-netflix-red" />
-                    <span>4000+ Titles</span>
+                    <span>8000+ Titles</span>
                   </div>
                   <div className="flex items-center gap-2">
                     <FiStar className="w-5 h-5 text-netflix-red" />
@@ -245,6 +287,8 @@ const Home = () => {
             selectedGenre={selectedGenre}
             setSelectedGenre={setSelectedGenre}
             genres={genres}
+            typeCounts={facets?.types}
+            genreCounts={facets?.genres}
             kidsMode={kidsMode}
             setKidsMode={setKidsMode}
             onClearFilters={handleClearFilters}
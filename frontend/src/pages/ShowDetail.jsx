@@ -24,13 +24,25 @@ const ShowDetail = () => {
         const showData = await showService.getShowById(id);
         setShow(showData);
 
+        // Fetch similar titles for "More Like This"
+        let similar = [];
+        try {
+          const similarData = await showService.getSimilarShows(id, 5);
+          similar = similarData.shows;
+        } catch (error) {
+          console.error('Error fetching similar shows:', error);
+        }
+        setRecommendations(similar);
+
         // Track view for recommendations (if authenticated)
         if (isAuthenticated) {
           try {
             await showService.trackView(id);
-            // Fetch recommendations
-            const recData = await showService.getRecommendations(5);
-            setRecommendations(recData.shows.filter(s => s.id !== id));
+            // Fall back to personal recommendations without similar titles
+            if (similar.length === 0) {
+              const recData = await showService.getRecommendations(5);
+              setRecommendations(recData.shows.filter(s => s.id !== id));
+            }
           } catch (error) {
             console.error('Error tracking view:', error);
           }
@@ -21,6 +21,11 @@ export const showService = {
     return response.data;
   },
 
+  async getSimilarShows(id, limit = 10) {
+    const response = await api.get(`/shows/${id}/similar`, { params: { limit } });
+    return response.data;
+  },
+
   async trackView(showId) {
     const response = await api.post('/shows/view', { show_id: showId });
     return response.data;
@@ -50,10 +50,19 @@ export default defineConfig({
   ],
   webServer: [
     {
-      command: 'cd ../backend && python -m uvicorn app.main:app --port 8000',
+      // Build the similar-titles index first - it isn't checked in
+      command: 'cd ../backend && python scripts/build_similarity_index.py && python -m uvicorn app.main:app --port 8000',
       url: 'http://localhost:8000/health',
       reuseExistingServer: true,
       timeout: 120000,
+      // Every test signs in from 127.0.0.1 - only keep the per-email
+      // limits, high enough for the suite and low enough to test
+      env: {
+        REGISTER_RATE_LIMIT_PER_IP: '0',
+        LOGIN_RATE_LIMIT_PER_IP: '0',
+        REGISTER_RATE_LIMIT_PER_EMAIL: '20',
+        LOGIN_RATE_LIMIT_PER_EMAIL: '20',
+      },
     },
     {
       command: 'cd ../frontend && npm run dev',
@@ -148,6 +148,44 @@ test.describe('Authentication API - Login', () => {
   });
 });
 
+test.describe('Authentication API - Rate Limiting', () => {
+  test('should answer 429 with Retry-After after too many logins', async ({ request }) => {
+    // Fresh email per run - the suite's backend only limits logins per email
+    const email = `limited_${Date.now()}_${Math.random().toString(36).slice(2)}@fletnix.com`;
+    let response;
+
+    for (let attempt = 0; attempt < 50; attempt++) {
+      response = await request.post(`${API_URL}/auth/login`, {
+        data: { email, password: 'WrongPass123!' },
+      });
+      if (response.status() === 429) break;
+      expect(response.status()).toBe(401);
+    }
+
+    expect(response.status()).toBe(429);
+    const retryAfter = Number(response.headers()['retry-after']);
+    expect(retryAfter).toBeGreaterThan(0);
+  });
+
+  test('should answer 429 with Retry-After after too many registrations of one email', async ({ request }) => {
+    const email = `limited_register_${Date.now()}_${Math.random().toString(36).slice(2)}@fletnix.com`;
+    let response;
+
+    for (let attempt = 0; attempt < 50; attempt++) {
+      response = await request.post(`${API_URL}/auth/register`, {
+        data: { email, password: 'LimitPass123!', age: 25 },
+      });
+      if (response.status() === 429) break;
+      // The first attempt registers the email, the rest find it taken
+      expect(response.status()).toBe(attempt === 0 ? 201 : 400);
+    }
+
+    expect(response.status()).toBe(429);
+    const retryAfter = Number(response.headers()['retry-after']);
+    expect(retryAfter).toBeGreaterThan(0);
+  });
+});
+
 test.describe('Authentication API - JWT Token', () => {
   test('should access protected endpoint with valid token', async ({ request }) => {
     // Register and login
@@ -63,6 +63,31 @@ test.describe('Recommendations API', () => {
     expect(viewBody.message).toContain('tracked');
   });
 
+  test('should track several views at once', async ({ request }) => {
+    const showsResponse = await request.get(`${API_URL}/shows?limit=3`);
+    const { shows } = await showsResponse.json();
+    const showIds = shows.map((show) => show.id);
+
+    const viewResponse = await request.post(`${API_URL}/shows/views`, {
+      headers: { Authorization: `Bearer ${authToken}` },
+      data: { show_ids: [...showIds, 'nonexistent123'] },
+    });
+
+    expect(viewResponse.status()).toBe(201);
+    const viewBody = await viewResponse.json();
+    expect(viewBody.tracked).toBe(showIds.length);
+    expect(viewBody.not_found).toEqual(['nonexistent123']);
+  });
+
+  test('should return 404 when tracking an unknown show', async ({ request }) => {
+    const viewResponse = await request.post(`${API_URL}/shows/view`, {
+      headers: { Authorization: `Bearer ${authToken}` },
+      data: { show_id: 'nonexistent123' },
+    });
+
+    expect(viewResponse.status()).toBe(404);
+  });
+
   test('should limit recommendations to specified count', async ({ request }) => {
     const limit = 5;
     const response = await request.get(
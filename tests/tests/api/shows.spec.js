@@ -66,6 +66,73 @@ test.describe('Shows API - Pagination', () => {
     const expectedPages = Math.ceil(body.total / 10);
     expect(body.pages).toBe(expectedPages);
   });
+
+  test('should return lean shows with view=summary', async ({ request }) => {
+    const response = await request.get(`${API_URL}/shows?limit=5&view=summary`);
+
+    expect(response.status()).toBe(200);
+    const body = await response.json();
+
+    expect(body.shows.length).toBeGreaterThan(0);
+    body.shows.forEach(show => {
+      expect(show).toHaveProperty('id');
+      expect(show).toHaveProperty('title');
+      expect(show).not.toHaveProperty('cast');
+      expect(show).not.toHaveProperty('director');
+    });
+  });
+
+  test('should return only the requested fields', async ({ request }) => {
+    const response = await request.get(`${API_URL}/shows?limit=5&fields=title,release_year`);
+
+    expect(response.status()).toBe(200);
+    const body = await response.json();
+
+    body.shows.forEach(show => {
+      expect(Object.keys(show).sort()).toEqual(['id', 'release_year', 'title']);
+    });
+  });
+
+  test('should reject unknown fields', async ({ request }) => {
+    const response = await request.get(`${API_URL}/shows?fields=title,password`);
+
+    expect(response.status()).toBe(400);
+  });
+
+  test('should serve repeated pages from the response cache', async ({ request }) => {
+    const response1 = await request.get(`${API_URL}/shows?page=2&limit=7`);
+    const response2 = await request.get(`${API_URL}/shows?page=2&limit=7`);
+
+    expect(response2.status()).toBe(200);
+    expect(['HIT', 'STALE']).toContain(response2.headers()['x-cache']);
+    expect(await response2.json()).toEqual(await response1.json());
+  });
+
+  test('should page with next_cursor in the same order as page numbers', async ({ request }) => {
+    const expected = await (await request.get(`${API_URL}/shows?page=1&limit=30`)).json();
+
+    const seen = [];
+    let url = `${API_URL}/shows?limit=10`;
+    for (let i = 0; i < 3; i++) {
+      const response = await request.get(url);
+      expect(response.status()).toBe(200);
+      const body = await response.json();
+
+      expect(body.shows.length).toBe(10);
+      expect(body.next_cursor).toBeTruthy();
+      seen.push(...body.shows.map((show) => show.id));
+      url = `${API_URL}/shows?limit=10&cursor=${encodeURIComponent(body.next_cursor)}`;
+    }
+
+    expect(new Set(seen).size).toBe(seen.length);
+    expect(seen).toEqual(expected.shows.map((show) => show.id));
+  });
+
+  test('should reject an invalid cursor', async ({ request }) => {
+    const response = await request.get(`${API_URL}/shows?cursor=garbage`);
+
+    expect(response.status()).toBe(400);
+  });
 });
 
 test.describe('Shows API - Type Filter', () => {
@@ -103,6 +170,21 @@ test.describe('Shows API - Type Filter', () => {
     // Total should be sum of movies and TV shows
     expect(allBody.total).toBe(movieBody.total + tvBody.total);
   });
+
+  test('should return type facet counts matching filtered totals', async ({ request }) => {
+    const allResponse = await request.get(`${API_URL}/shows`);
+    const movieResponse = await request.get(`${API_URL}/shows?type=Movie`);
+
+    const allBody = await allResponse.json();
+    const movieBody = await movieResponse.json();
+
+    // Facets are only returned while the in-memory catalog is loaded
+    if (allBody.facets) {
+      expect(allBody.facets.types['Movie']).toBe(movieBody.total);
+      // The type facet ignores the type filter itself
+      expect(movieBody.facets.types).toEqual(allBody.facets.types);
+    }
+  });
 });
 
 test.describe('Shows API - Search Functionality', () => {
@@ -144,6 +226,21 @@ test.describe('Shows API - Search Functionality', () => {
     expect(body.total).toBe(0);
   });
 
+  test('should order search results by relevance with rank=true', async ({ request }) => {
+    const plain = await (await request.get(`${API_URL}/shows?search=love`)).json();
+    const response = await request.get(`${API_URL}/shows?search=love&rank=true&limit=5`);
+
+    expect(response.status()).toBe(200);
+    const body = await response.json();
+
+    // Same matches, but whole-word title matches come first
+    expect(body.total).toBe(plain.total);
+    expect(body.next_cursor).toBeNull();
+    body.shows.forEach((show) => {
+      expect(show.title).toMatch(/\blove\b/i);
+    });
+  });
+
   test('should combine search with type filter', async ({ request }) => {
     const response = await request.get(`${API_URL}/shows?search=love&type=Movie`);
 
@@ -158,13 +255,31 @@ test.describe('Shows API - Search Functionality', () => {
 
 test.describe('Shows API - Genre Filter', () => {
   test('should filter shows by genre', async ({ request }) => {
-    const response = await request.get(`${API_URL}/shows?genre=Comedy`);
+    const response = await request.get(`${API_URL}/shows?genre=Comedies`);
 
     expect(response.status()).toBe(200);
     const body = await response.json();
 
+    expect(body.shows.length).toBeGreaterThan(0);
     body.shows.forEach((show) => {
-      expect(show.listed_in.toLowerCase()).toContain('comed');
+      expect(show.listed_in.split(', ')).toContain('Comedies');
+    });
+  });
+
+  test('should match whole genre names only', async ({ request }) => {
+    // TV shows are filed under "TV Dramas", never "Dramas" - which used to
+    // match them as a substring
+    const response = await request.get(`${API_URL}/shows?genre=Dramas&type=TV%20Show`);
+
+    expect(response.status()).toBe(200);
+    const body = await response.json();
+    expect(body.total).toBe(0);
+
+    const tvDramas = await request.get(`${API_URL}/shows?genre=TV%20Dramas&type=TV%20Show`);
+    const tvDramasBody = await tvDramas.json();
+    expect(tvDramasBody.total).toBeGreaterThan(0);
+    tvDramasBody.shows.forEach((show) => {
+      expect(show.listed_in.split(', ')).toContain('TV Dramas');
     });
   });
 
@@ -178,6 +293,29 @@ test.describe('Shows API - Genre Filter', () => {
     expect(genres.length).toBeGreaterThan(0);
     expect(genres).toContain('Comedies');
   });
+
+  test('should return genre counts', async ({ request }) => {
+    const response = await request.get(`${API_URL}/shows/genres/counts`);
+
+    expect(response.status()).toBe(200);
+    const genres = await response.json();
+
+    const comedies = genres.find((genre) => genre.name === 'Comedies');
+    expect(comedies.count).toBeGreaterThan(0);
+  });
+
+  test('should revalidate genres with ETag', async ({ request }) => {
+    const response = await request.get(`${API_URL}/shows/genres`);
+    const etag = response.headers()['etag'];
+
+    expect(etag).toBeTruthy();
+    expect(response.headers()['cache-control']).toContain('max-age');
+
+    const revalidated = await request.get(`${API_URL}/shows/genres`, {
+      headers: { 'If-None-Match': etag },
+    });
+    expect(revalidated.status()).toBe(304);
+  });
 });
 
 test.describe('Shows API - Show Details', () => {
@@ -301,6 +439,48 @@ test.describe('Shows API - Reviews (OMDB Integration)', () => {
   });
 });
 
+test.describe('Shows API - Similar Shows', () => {
+  // The webServer builds the index, but a reused server may not have one
+  const skipWithoutIndex = (response) => {
+    test.skip(response.status() === 503, 'similarity index not built');
+  };
+
+  test('should get similar shows without the show itself', async ({ request }) => {
+    const showsResponse = await request.get(`${API_URL}/shows?limit=1`);
+    const { shows } = await showsResponse.json();
+    const showId = shows[0].id;
+
+    const response = await request.get(`${API_URL}/shows/${showId}/similar?limit=5`);
+    skipWithoutIndex(response);
+
+    expect(response.status()).toBe(200);
+    const body = await response.json();
+
+    expect(Array.isArray(body.shows)).toBe(true);
+    expect(body.shows.length).toBeLessThanOrEqual(5);
+    expect(body.shows.some((show) => show.id === showId)).toBe(false);
+  });
+
+  test('should only return kids content in kids mode', async ({ request }) => {
+    const showsResponse = await request.get(`${API_URL}/shows?limit=1`);
+    const { shows } = await showsResponse.json();
+
+    const response = await request.get(`${API_URL}/shows/${shows[0].id}/similar?kids_mode=true`);
+    skipWithoutIndex(response);
+
+    expect(response.status()).toBe(200);
+    const body = await response.json();
+    const adultRatings = ['R', 'NC-17', 'TV-MA'];
+    expect(body.shows.every((show) => !adultRatings.includes(show.rating))).toBe(true);
+  });
+
+  test('should return 404 for an unknown show', async ({ request }) => {
+    const response = await request.get(`${API_URL}/shows/nonexistent-id/similar`);
+
+    expect(response.status()).toBe(404);
+  });
+});
+
 test.describe('Health Check', () => {
   test('should return healthy status', async ({ request }) => {
     const response = await request.get('http://localhost:8000/health');
@@ -310,6 +490,23 @@ test.describe('Health Check', () => {
     expect(body.status).toBe('healthy');
   });
 
+  test('should report ready once warmed up', async ({ request }) => {
+    await expect.poll(
+      async () => (await request.get('http://localhost:8000/ready')).status(),
+      { timeout: 30000 }
+    ).toBe(200);
+
+    const body = await (await request.get('http://localhost:8000/ready')).json();
+    expect(body.status).toBe('ready');
+    expect(body.steps_ms).toHaveProperty('catalog');
+  });
+
+  test('should not expose metrics without a token', async ({ request }) => {
+    const response = await request.get('http://localhost:8000/metrics');
+
+    expect([401, 404]).toContain(response.status());
+  });
+
   test('should return API info on root', async ({ request }) => {
     const response = await request.get('http://localhost:8000/');
 